@@ -5,22 +5,24 @@ Speech Service CLI
 Simple CLI to test audio-to-IPA and text-to-IPA conversion.
 """
 
+import os
 import sys
+from collections import Counter
 from pathlib import Path
 
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
-from src.audio.loader import AudioLoader
-from src.ipa.audio_to_ipa import WhisperIPAConverter
-from src.ipa.text_to_ipa import GruutIPAConverter
 from src.ipa.normalizer import IPANormalizer
-from src.ipa.aligner import PhonemeAligner
 
 
-console = Console()
+# Display limits for the comparison output
+MAX_DIFFERENCES = 10
+MAX_DISPLAY_CHARS = 80
+
+
+def _truncate(text: str, limit: int = MAX_DISPLAY_CHARS) -> str:
+    """Truncate text for display, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else f"{text[:limit]}…"
 
 
 @click.command()
@@ -48,7 +50,13 @@ console = Console()
     type=str,
     help='Device for Whisper model (cpu/cuda, default: auto-detect)'
 )
-def compare_pronunciation(audio: str, text: str, language: str, device: str):
+@click.option(
+    '--verbose',
+    is_flag=True,
+    default=False,
+    help='Print full tracebacks on errors (also enabled by LING_DEBUG=1)'
+)
+def compare_pronunciation(audio: str, text: str, language: str, device: str, verbose: bool):
     """
     Compare pronunciation between audio and text transcript.
 
@@ -58,8 +66,19 @@ def compare_pronunciation(audio: str, text: str, language: str, device: str):
     Example:
         python cli.py --audio sample.webm --text "Hello world"
     """
+    # rich is only needed once a command actually runs, not for `--help`
+    from rich.console import Console
+    from rich.table import Table
+    from rich.panel import Panel
+
+    console = Console()
     console.print("\n[bold cyan]Speech Service - IPA Comparison[/bold cyan]\n")
 
+    # Heavy imports (librosa, torch, transformers, gruut) are deferred so
+    # `--help` and argument errors return immediately
+    from src.audio.loader import AudioLoader
+    from src.pipeline import build_pipeline
+
     try:
         # 1. Load audio
         console.print("[yellow]📁 Loading audio file...[/yellow]")
@@ -69,20 +88,18 @@ def compare_pronunciation(audio: str, text: str, language: str, device: str):
 
         # 2. Convert audio to IPA
         console.print("\n[yellow]🎤 Converting audio to IPA with Whisper...[/yellow]")
-        whisper_converter = WhisperIPAConverter(device=device)
-        audio_ipa = whisper_converter.audio_to_ipa(audio_array, sample_rate)
+        pipeline = build_pipeline(device=device, language=language)
+        audio_ipa = pipeline.whisper_converter.audio_to_ipa(audio_array, sample_rate)
         console.print(f"[green]✓ Audio IPA transcription complete[/green]")
 
         # 3. Convert text to IPA
         console.print("\n[yellow]📝 Converting text to IPA with gruut...[/yellow]")
-        gruut_converter = GruutIPAConverter(language=language)
-        text_ipa = gruut_converter.text_to_ipa(text)
+        text_ipa = pipeline.gruut_converter.text_to_ipa(text)
         console.print(f"[green]✓ Text IPA conversion complete[/green]")
 
         # 4. Align phonemes
         console.print("\n[yellow]🔍 Aligning phonemes...[/yellow]")
-        aligner = PhonemeAligner()
-        alignment = aligner.align(audio_ipa, text_ipa)
+        alignment = pipeline.aligner.align(audio_ipa, text_ipa)
         console.print(f"[green]✓ Phoneme alignment complete[/green]")
 
         # 5. Normalize and compare
@@ -124,12 +141,13 @@ def compare_pronunciation(audio: str, text: str, language: str, device: str):
             diff_table.add_column("Text", style="green", width=15)
 
             # Show first 10 differences
-            for i, (pos, char1, char2) in enumerate(comparison['differences'][:10]):
+            differences = comparison['differences']
+            for pos, char1, char2 in differences[:MAX_DIFFERENCES]:
                 char1_display = repr(char1) if char1 else "[missing]"
                 char2_display = repr(char2) if char2 else "[missing]"
                 diff_table.add_row(str(pos), char1_display, char2_display)
 
-            if len(comparison['differences']) > 10:
+            if len(differences) > MAX_DIFFERENCES:
                 diff_table.add_row("...", "...", "...")
 
             console.print(diff_table)
@@ -140,29 +158,25 @@ def compare_pronunciation(audio: str, text: str, language: str, device: str):
             aligned1, match_str, aligned2 = normalizer.get_alignment(audio_ipa, text_ipa)
 
             # Show first 80 characters
-            max_display = 80
-            if len(aligned1) > max_display:
-                aligned1 = aligned1[:max_display] + "..."
-                aligned2 = aligned2[:max_display] + "..."
-                match_str = match_str[:max_display] + "..."
-
-            console.print(f"Audio: {aligned1}")
-            console.print(f"       {match_str}")
-            console.print(f"Text:  {aligned2}")
+            console.print(f"Audio: {_truncate(aligned1)}")
+            console.print(f"       {_truncate(match_str)}")
+            console.print(f"Text:  {_truncate(aligned2)}")
 
         # Phoneme-level analysis
         console.print("\n[bold cyan]Phoneme Analysis:[/bold cyan]")
 
-        # Count phoneme types
-        matches = sum(1 for _, _, t in alignment if t == 'match')
-        substitutions = sum(1 for _, _, t in alignment if t == 'substitute')
-        deletions = sum(1 for _, _, t in alignment if t == 'delete')
-        insertions = sum(1 for _, _, t in alignment if t == 'insert')
+        # Count phoneme types in a single pass
+        counts = Counter(t for _, _, t in alignment)
+        matches = counts['match']
+        substitutions = counts['substitute']
+        deletions = counts['delete']
+        insertions = counts['insert']
         total = len(alignment)
+        match_pct = matches / total * 100 if total else 0.0
 
         phoneme_stats_text = f"""
 [bold]Total Phonemes:[/bold] {total}
-[bold]Matches:[/bold] {matches} ({matches/total*100:.1f}% if total > 0 else 0)
+[bold]Matches:[/bold] {matches} ({match_pct:.1f}%)
 [bold]Substitutions:[/bold] {substitutions}
 [bold]Deletions (not said):[/bold] {deletions}
 [bold]Insertions (extra):[/bold] {insertions}
@@ -195,8 +209,11 @@ def compare_pronunciation(audio: str, text: str, language: str, device: str):
         sys.exit(1)
     except Exception as e:
         console.print(f"\n[bold red]Unexpected error:[/bold red] {str(e)}\n", style="red")
-        import traceback
-        console.print(traceback.format_exc())
+        if verbose or os.getenv("LING_DEBUG"):
+            import traceback
+            console.print(traceback.format_exc())
+        else:
+            console.print("[yellow]Re-run with --verbose for the full traceback.[/yellow]\n")
         sys.exit(1)
 
 
@@ -2,6 +2,13 @@
 FastAPI-based pronunciation analysis API.
 """
 
-from .main import app
-
 __all__ = ["app"]
+
+
+def __getattr__(name):
+    # Imported on first access so submodules (e.g. batching, audio_fetcher)
+    # can be used without loading the whole app and its models' libraries
+    if name == "app":
+        from .main import app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
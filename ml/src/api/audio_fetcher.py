@@ -2,27 +2,245 @@
 Audio fetcher for downloading audio from presigned URLs.
 """
 
-import os
-import tempfile
-from typing import Tuple
+import asyncio
+import logging
+from concurrent.futures import Executor
+from functools import partial
+from typing import AsyncIterator, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
 
 import httpx
 import numpy as np
 
 from src.audio.loader import AudioLoader
 
+logger = logging.getLogger(__name__)
+
+# Shared HTTP client so presigned-URL downloads reuse pooled keep-alive
+# connections instead of paying a TCP + TLS handshake per request
+_client: Optional[httpx.AsyncClient] = None
+
+
+# Fail fast on unreachable hosts, but allow slow bodies to finish streaming
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+
+def open_http_client(timeout: httpx.Timeout = DEFAULT_TIMEOUT) -> httpx.AsyncClient:
+    """
+    Create the shared HTTP client. Called at startup.
+
+    Args:
+        timeout: Default HTTP request timeout
+
+    Returns:
+        The shared httpx.AsyncClient
+    """
+    global _client
+
+    if _client is None:
+        # HTTP/2 lets concurrent downloads share one multiplexed connection;
+        # retries re-attempt failed connects (e.g. a dropped keep-alive socket)
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128)
+        )
+        _client = httpx.AsyncClient(
+            timeout=timeout,
+            transport=transport,
+            event_hooks={"request": [_log_request], "response": [_log_response]}
+        )
+    return _client
+
+
+async def _log_request(request: httpx.Request):
+    """Debug-log an outgoing request (event hook for the shared client)."""
+    # Host and path only: presigned query strings carry credentials
+    logger.debug("HTTP %s %s%s", request.method, request.url.host, request.url.path)
+
+
+async def _log_response(response: httpx.Response):
+    """
+    Debug-log a response (event hook for the shared client).
+
+    Transport-level connect retries happen below the hooks and are not
+    visible here; a request that needed them is still logged only once.
+    """
+    request = response.request
+    logger.debug(
+        "HTTP %s %s%s -> %d (%s)",
+        request.method,
+        request.url.host,
+        request.url.path,
+        response.status_code,
+        response.http_version
+    )
+
+
+async def close_http_client():
+    """Close the shared HTTP client. Called at shutdown."""
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def prewarm_http_client(urls: Sequence[str]):
+    """
+    Open pooled connections to known upstream hosts ahead of the first request.
+
+    Failures are ignored - warmup must never block startup.
+
+    Args:
+        urls: URLs to send a HEAD request to (e.g. the S3/MinIO endpoint)
+    """
+    client = get_http_client()
+    results = await asyncio.gather(
+        *(client.head(url, timeout=5.0) for url in urls),
+        return_exceptions=True
+    )
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            logger.debug("Connection prewarm failed for %s: %s", url, result)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use if needed.
+
+    Returns:
+        The shared httpx.AsyncClient
+    """
+    return _client or open_http_client()
+
+
+# Content-Type (without parameters) -> file extension
+_MIME_EXTENSIONS = {
+    "audio/webm": ".webm",
+    "video/webm": ".webm",
+    "audio/wav": ".wav",
+    "audio/wave": ".wav",
+    "audio/x-wav": ".wav",
+    "audio/vnd.wave": ".wav",
+    "audio/mpeg": ".mp3",
+    "audio/mp3": ".mp3",
+    "audio/flac": ".flac",
+    "audio/x-flac": ".flac",
+    "audio/ogg": ".ogg",
+    "audio/mp4": ".m4a",
+    "audio/x-m4a": ".m4a",
+}
+
+# Extensions recognised on the URL when the content-type is missing or generic
+_URL_EXTENSIONS = (".webm", ".wav", ".mp3", ".flac", ".ogg", ".m4a")
+
+
+def _pick_extension(content_type: str, audio_url: str) -> str:
+    """
+    Determine the audio file extension from the content-type or URL.
+
+    Args:
+        content_type: Response Content-Type header value
+        audio_url: URL the audio was fetched from
+
+    Returns:
+        File extension including the leading dot
+    """
+    ext = _MIME_EXTENSIONS.get(content_type.split(";", 1)[0].strip().lower())
+    if ext:
+        return ext
+
+    # Check the path only - presigned URLs carry long signed query strings
+    path = urlsplit(audio_url).path.lower()
+    if path.endswith(_URL_EXTENSIONS):
+        return path[path.rfind("."):]
+
+    # Default to webm since that's what the app uses
+    return ".webm"
+
+
+async def _decode_stream(chunks: AsyncIterator[bytes]) -> np.ndarray:
+    """
+    Decode audio with FFmpeg while it is still downloading.
+
+    Chunks are written to FFmpeg's stdin as they arrive, so decoding overlaps
+    the network transfer instead of starting after the last byte.
+
+    Args:
+        chunks: Encoded audio bytes, in order
+
+    Returns:
+        16kHz mono float32 samples
+
+    Raises:
+        RuntimeError: If FFmpeg is missing or fails to decode the audio
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *AudioLoader.FFMPEG_DECODE_COMMAND,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except OSError as e:
+        raise RuntimeError(
+            f"Failed to decode audio with FFmpeg. Is FFmpeg installed? Error: {e}"
+        ) from e
+
+    # Drain the outputs concurrently so FFmpeg never blocks on a full pipe
+    stdout_task = asyncio.ensure_future(proc.stdout.read())
+    stderr_task = asyncio.ensure_future(proc.stderr.read())
+
+    try:
+        try:
+            async for chunk in chunks:
+                proc.stdin.write(chunk)
+                await proc.stdin.drain()
+            proc.stdin.close()
+        except (BrokenPipeError, ConnectionResetError):
+            # FFmpeg exited early; its stderr below says why
+            pass
+
+        pcm, stderr = await asyncio.gather(stdout_task, stderr_task)
+        await proc.wait()
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        for task in (stdout_task, stderr_task):
+            task.cancel()
+
+    if proc.returncode != 0:
+        detail = stderr.decode(errors="replace").strip()
+        raise RuntimeError(
+            f"Failed to decode audio with FFmpeg. Is FFmpeg installed? Error: {detail}"
+        )
+
+    return np.frombuffer(pcm, dtype=np.float32)
+
 
 class AudioFetcher:
     """Fetches and processes audio from presigned URLs."""
 
-    def __init__(self, timeout: float = 60.0):
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        executor: Optional[Executor] = None
+    ):
         """
         Initialize audio fetcher.
 
         Args:
-            timeout: HTTP request timeout in seconds
+            timeout: HTTP request timeout in seconds (None = client default)
+            client: HTTP client to download with (None = the shared client)
+            executor: Executor for CPU-bound decoding/preprocessing
+                (None = asyncio default)
         """
         self.timeout = timeout
+        self.client = client
+        self.executor = executor
         self.loader = AudioLoader()
 
     async def fetch_and_load(
@@ -46,50 +264,46 @@ class AudioFetcher:
             httpx.HTTPError: If download fails
             RuntimeError: If audio processing fails
         """
-        # Download audio to temp file
-        temp_path = None
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(audio_url)
-                response.raise_for_status()
-
-                # Determine file extension from content-type or URL
-                content_type = response.headers.get("content-type", "")
-                if "webm" in content_type or audio_url.endswith(".webm"):
-                    ext = ".webm"
-                elif "wav" in content_type or audio_url.endswith(".wav"):
-                    ext = ".wav"
-                elif "mp3" in content_type or audio_url.endswith(".mp3"):
-                    ext = ".mp3"
-                else:
-                    # Default to webm since that's what the app uses
-                    ext = ".webm"
-
-                # Write to temp file
-                with tempfile.NamedTemporaryFile(
-                    suffix=ext,
-                    delete=False
-                ) as tmp:
-                    tmp.write(response.content)
-                    temp_path = tmp.name
-
-            # Load and process audio
-            audio_array, sample_rate, quality_report = self.loader.load_audio_with_quality_check(
-                temp_path,
-                apply_vad=apply_vad,
-                normalize=normalize,
-                warn_on_quality=False  # We'll handle warnings in the response
-            )
-
-            return audio_array, sample_rate, quality_report
-
-        finally:
-            # Clean up temp file
-            if temp_path and os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except Exception:
-                    pass  # Ignore cleanup errors
+        client = self.client or get_http_client()
+        timeout = httpx.USE_CLIENT_DEFAULT if self.timeout is None else self.timeout
+
+        async with client.stream("GET", audio_url, timeout=timeout) as response:
+            response.raise_for_status()
+
+            ext = _pick_extension(response.headers.get("content-type", ""), audio_url)
+
+            if ext in AudioLoader.SOUNDFILE_EXTENSIONS:
+                # Decode straight from memory - no temp file round-trip
+                data = await response.aread()
+                audio_array, sample_rate = await self._run(
+                    self.loader.load_audio_from_bytes,
+                    data,
+                    ext,
+                    apply_vad=apply_vad,
+                    normalize=normalize
+                )
+            else:
+                # WebM etc.: FFmpeg decodes chunks as they arrive
+                audio_array = await _decode_stream(response.aiter_bytes(1 << 16))
+                audio_array, sample_rate = await self._run(
+                    self.loader.preprocess,
+                    audio_array,
+                    AudioLoader.WHISPER_SAMPLE_RATE,
+                    apply_vad=apply_vad,
+                    normalize=normalize
+                )
+
+        quality_report = await self._run(
+            self.loader.assess_audio_quality, audio_array, sample_rate
+        )
+
+        return audio_array, sample_rate, quality_report
+
+    def _run(self, fn, *args, **kwargs) -> asyncio.Future:
+        """Run CPU-bound work on the executor, off the event loop."""
+        return asyncio.get_running_loop().run_in_executor(
+            self.executor, partial(fn, *args, **kwargs)
+        )
 
 
 # Convenience function
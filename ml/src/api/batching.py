@@ -0,0 +1,170 @@
+"""
+Dynamic micro-batching for the Whisper IPA model.
+
+Concurrent /analyze-pronunciation requests each need one Whisper forward
+pass. Running them one at a time leaves the GPU mostly idle, so requests
+are queued and drained in small batches: the scheduler waits up to
+``max_wait_ms`` for up to ``max_batch_size`` clips, runs a single batched
+``generate`` on a worker thread, and resolves each request's future.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.ipa.audio_to_ipa import WhisperIPAConverter
+
+
+# (audio, sample_rate, language, future)
+_QueueItem = Tuple[np.ndarray, int, Optional[str], asyncio.Future]
+
+
+class BatchScheduler:
+    """
+    Collects concurrent audio-to-IPA requests into batched Whisper calls.
+
+    Items only share a batch when their sample rate and language hint match,
+    since both apply to the whole batch.
+    """
+
+    def __init__(
+        self,
+        converter: "WhisperIPAConverter",
+        max_batch_size: int = 16,
+        max_wait_ms: float = 20.0,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            converter: Loaded Whisper IPA converter
+            max_batch_size: Maximum clips per forward pass
+            max_wait_ms: How long to wait for more requests after the first
+            executor: Executor for the blocking forward pass (None = asyncio default)
+        """
+        self.converter = converter
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.executor = executor
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._closed = False
+
+    async def submit(
+        self,
+        audio_array: np.ndarray,
+        sampling_rate: int = 16000,
+        language: Optional[str] = None
+    ) -> str:
+        """
+        Queue a clip for transcription and wait for its IPA.
+
+        Args:
+            audio_array: Audio as numpy array
+            sampling_rate: Sample rate of audio
+            language: Language code for Whisper hints (e.g., 'en')
+
+        Returns:
+            IPA transcription string
+
+        Raises:
+            RuntimeError: If the scheduler has been closed
+        """
+        if self._closed:
+            raise RuntimeError("Batch scheduler shut down")
+
+        # Started lazily: load_models runs on a worker thread with no event loop
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self.run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((audio_array, sampling_rate, language, future))
+        return await future
+
+    async def run(self):
+        """Drain the queue forever, one batch at a time."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            try:
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                for group in self._group(batch).values():
+                    await self._process(group)
+            except asyncio.CancelledError:
+                # Items already off the queue would otherwise wait forever
+                self._fail(batch, RuntimeError("Batch scheduler shut down"))
+                raise
+
+    async def close(self):
+        """Stop the worker and fail any requests still waiting."""
+        self._closed = True
+        if self._worker is None:
+            return
+
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        pending = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        self._fail(pending, RuntimeError("Batch scheduler shut down"))
+
+    @staticmethod
+    def _fail(items: List[_QueueItem], error: Exception):
+        """Fail every still-unresolved request in items."""
+        for *_, future in items:
+            if not future.done():
+                future.set_exception(error)
+
+    @staticmethod
+    def _group(batch: List[_QueueItem]) -> Dict[Tuple[int, Optional[str]], List[_QueueItem]]:
+        """Split a batch by (sample_rate, language)."""
+        groups: Dict[Tuple[int, Optional[str]], List[_QueueItem]] = {}
+        for item in batch:
+            groups.setdefault((item[1], item[2]), []).append(item)
+        return groups
+
+    async def _process(self, group: List[_QueueItem]):
+        """Run one batched forward pass and resolve the group's futures."""
+        _, sampling_rate, language, _ = group[0]
+        audio_arrays = [audio for audio, *_ in group]
+
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                partial(
+                    self.converter.audio_to_ipa_batch,
+                    audio_arrays,
+                    sampling_rate,
+                    language=language
+                )
+            )
+        except Exception as e:
+            self._fail(group, e)
+            return
+
+        for (*_, future), ipa in zip(group, results):
+            # A client may have disconnected and cancelled its future
+            if not future.done():
+                future.set_result(ipa)
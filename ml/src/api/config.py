@@ -0,0 +1,85 @@
+"""
+Service configuration loaded from environment variables.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Runtime settings for the pronunciation analysis API."""
+
+    device: Optional[str] = None  # None = auto-detect
+    default_language: str = "en-us"
+    cors_origins: Tuple[str, ...] = ("*",)
+    prewarm_urls: Tuple[str, ...] = ()
+    log_level: str = "INFO"
+    model_cache_dir: Optional[str] = None  # None = Hugging Face cache
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """
+        Build settings from the process environment.
+
+        Returns:
+            Settings populated from ML_DEVICE, ML_DEFAULT_LANGUAGE, CORS_ORIGINS,
+            ML_PREWARM_URLS, ML_LOG_LEVEL and ML_MODEL_CACHE_DIR
+        """
+        return cls(
+            device=os.getenv("ML_DEVICE") or None,
+            default_language=os.getenv("ML_DEFAULT_LANGUAGE", cls.default_language),
+            cors_origins=_split_csv(os.getenv("CORS_ORIGINS", "*")),
+            prewarm_urls=_split_csv(os.getenv("ML_PREWARM_URLS", "")),
+            log_level=os.getenv("ML_LOG_LEVEL", cls.log_level).upper(),
+            model_cache_dir=os.getenv("ML_MODEL_CACHE_DIR") or None,
+        )
+
+
+def _split_csv(value: str) -> Tuple[str, ...]:
+    """
+    Parse a comma-separated list (CORS origins, URLs).
+
+    Args:
+        value: Comma-separated values (e.g. "http://a.com, http://b.com")
+
+    Returns:
+        Tuple of values with whitespace trimmed and empty entries dropped
+    """
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+def _load_dotenv():
+    """
+    Load a local .env file into the environment during development.
+
+    Skipped outside ENVIRONMENT=development, and when python-dotenv isn't
+    installed, so production never pays for the import. Existing
+    environment variables always win over values in the file.
+    """
+    if os.getenv("ENVIRONMENT", "development") != "development":
+        return
+
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+
+    load_dotenv()
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the process-wide settings instance.
+
+    The environment is read once per process; call
+    ``get_settings.cache_clear()`` to force a reload (e.g. in tests).
+
+    Returns:
+        Cached Settings instance
+    """
+    _load_dotenv()
+    return Settings.from_env()
@@ -3,49 +3,109 @@ FastAPI application for pronunciation analysis.
 
 Run with:
     uvicorn src.api.main:app --host 0.0.0.0 --port 8000
+
+For development with auto-reload (event-driven via watchfiles, which
+ships with uvicorn[standard]):
+    uvicorn src.api.main:app --reload --reload-dir src --reload-include "*.py"
 """
 
-import os
+import asyncio
+import logging
 from contextlib import asynccontextmanager
+from typing import Optional
 
 from fastapi import FastAPI
+from fastapi.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 
-from .routes import router, load_models, get_models_loaded
+from .audio_fetcher import open_http_client, close_http_client, prewarm_http_client
+from .config import get_settings
+from .routes import router, load_models, cancel_model_loading, close_models, get_models_loaded
 from .schemas import HealthResponse
 
+# Request-level diagnostics (e.g. per-phoneme alignments) are logged at DEBUG;
+# set ML_LOG_LEVEL=DEBUG to see them
+logging.basicConfig(
+    level=get_settings().log_level,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup/shutdown events.
     """
-    # Startup: Load models
-    device = os.getenv("ML_DEVICE", None)  # None = auto-detect
-    language = os.getenv("ML_DEFAULT_LANGUAGE", "en-us")
-
-    load_models(device=device, language=language)
+    settings = get_settings()
+
+    # Opened first: load_models hands the shared client to the AudioFetcher
+    open_http_client()
+
+    # Load models on a worker thread so the server can answer
+    # /health (status="starting") while the weights materialize
+    app.state.model_load_error = None
+    app.state.model_loading = asyncio.create_task(
+        _load_models_in_background(
+            app, settings.device, settings.default_language, settings.model_cache_dir
+        )
+    )
+    await prewarm_http_client(settings.prewarm_urls)
 
     yield
 
-    # Shutdown: Cleanup (if needed)
+    # Shutdown: Cleanup
     print("Shutting down pronunciation analysis API...")
 
+    # A load still in progress stops at its next step; wait for it to settle
+    # (the interpreter joins its thread at exit anyway) so close_models()
+    # sees everything it published
+    cancel_model_loading()
+    await app.state.model_loading
+    await close_models()
+    await close_http_client()
+
+
+async def _load_models_in_background(
+    app: FastAPI,
+    device: Optional[str],
+    language: str,
+    model_cache_dir: Optional[str]
+):
+    """
+    Run the blocking model load in a thread.
+
+    Nothing awaits this task, so a failure is recorded on app.state for
+    /health to report instead of being raised.
+    """
+    try:
+        await asyncio.to_thread(
+            load_models,
+            device=device,
+            language=language,
+            model_cache_dir=model_cache_dir
+        )
+    except Exception as e:
+        print(f"Failed to load models: {e}")
+        app.state.model_load_error = e
+
 
 app = FastAPI(
     title="Pronunciation Analysis API",
     description="Analyzes pronunciation by comparing audio to expected text using IPA phoneme alignment",
     version="1.0.0",
-    lifespan=lifespan
-)
-
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=os.getenv("CORS_ORIGINS", "*").split(","),
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    lifespan=lifespan,
+    # orjson serializes long IPA strings and base64 audio several times faster
+    default_response_class=ORJSONResponse,
+    middleware=[
+        Middleware(
+            CORSMiddleware,
+            allow_origins=list(get_settings().cors_origins),
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        ),
+    ]
 )
 
 # Include routes
@@ -54,7 +114,21 @@ app.include_router(router, prefix="/api/v1")
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
-    """Health check endpoint."""
+    """
+    Health check endpoint.
+
+    Returns HTTP 200 once the server is accepting connections (use it as a
+    liveness probe). Models load in the background after startup, so
+    readiness checks should gate traffic on `model_loaded` being true, not
+    on the status code. If loading failed, returns HTTP 503 with
+    status="failed" so the orchestrator replaces the task.
+    """
+    if getattr(app.state, "model_load_error", None) is not None:
+        return JSONResponse(
+            status_code=503,
+            content=HealthResponse(status="failed", model_loaded=False).model_dump()
+        )
+
     return HealthResponse(
         status="healthy" if get_models_loaded() else "starting",
         model_loaded=get_models_loaded()
@@ -2,13 +2,25 @@
 API route handlers for pronunciation analysis.
 """
 
+import asyncio
+import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Optional
 
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse, Response
 import httpx
+import numpy as np
 
-import base64
+# SIMD base64 for large TTS payloads; stdlib API-compatible fallback
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
 
 from .schemas import (
     PronunciationRequest,
@@ -22,12 +34,16 @@ from .schemas import (
     SynthesizeRequest,
     SynthesizeResponse,
 )
-from .audio_fetcher import AudioFetcher
+from .audio_fetcher import AudioFetcher, get_http_client
+from .batching import BatchScheduler
+from src.pipeline import build_pipeline
 from src.ipa.audio_to_ipa import WhisperIPAConverter
-from src.ipa.text_to_ipa import GruutIPAConverter
-from src.ipa.aligner import PhonemeAligner
+from src.ipa.text_to_ipa import GruutIPAConverter, text_to_ipa_cached
+from src.ipa.aligner import PhonemeAligner, MATCH_TYPES
 from src.stt.transcriber import FasterWhisperTranscriber
-from src.tts.synthesizer import ChatterboxSynthesizer
+from src.tts.synthesizer import ChatterboxSynthesizer, SynthesisResult
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -36,42 +52,148 @@ whisper_converter: Optional[WhisperIPAConverter] = None
 gruut_converter: Optional[GruutIPAConverter] = None
 aligner: Optional[PhonemeAligner] = None
 audio_fetcher: Optional[AudioFetcher] = None
+ipa_scheduler: Optional[BatchScheduler] = None
+cpu_executor: Optional[ThreadPoolExecutor] = None
 stt_transcriber: Optional[FasterWhisperTranscriber] = None
 tts_synthesizer: Optional[ChatterboxSynthesizer] = None
 
 
+# Set at shutdown so a load_models still running on its worker thread stops
+# at its next step instead of publishing models nothing will clean up
+_stop_loading = threading.Event()
+
+
 def get_models_loaded() -> bool:
     """Check if models are loaded."""
     return whisper_converter is not None
 
 
-def load_models(device: Optional[str] = None, language: str = "en-us"):
+def cancel_model_loading():
+    """Ask an in-progress load_models to stop at its next step. Called at shutdown."""
+    _stop_loading.set()
+
+
+def _loading_cancelled() -> bool:
+    """Check whether shutdown has asked load_models to stop."""
+    if _stop_loading.is_set():
+        print("Model loading cancelled by shutdown")
+        return True
+    return False
+
+
+async def close_models():
+    """Stop background workers started for the loaded models. Called at shutdown."""
+    if ipa_scheduler is not None:
+        await ipa_scheduler.close()
+    if cpu_executor is not None:
+        cpu_executor.shutdown(wait=False)
+
+
+def load_models(
+    device: Optional[str] = None,
+    language: str = "en-us",
+    model_cache_dir: Optional[str] = None
+):
     """
     Load ML models. Called at startup.
 
+    Nothing is published to the module globals until every model has
+    loaded, and loading stops early if cancel_model_loading() was called,
+    so shutdown never races a half-initialized set of workers.
+
     Args:
         device: Device for Whisper model ('cuda', 'cpu', or None for auto)
         language: Default language for text-to-IPA
+        model_cache_dir: Where faster-whisper keeps its converted model
+            (None = Hugging Face cache)
     """
-    global whisper_converter, gruut_converter, aligner, audio_fetcher, stt_transcriber, tts_synthesizer
+    global whisper_converter, gruut_converter, aligner, audio_fetcher, ipa_scheduler, cpu_executor, stt_transcriber, tts_synthesizer
 
     print("Loading pronunciation analysis models...")
 
-    whisper_converter = WhisperIPAConverter(device=device)
-    gruut_converter = GruutIPAConverter(language=language)
-    aligner = PhonemeAligner()
-    audio_fetcher = AudioFetcher()
+    # One pipeline per process; handlers share these instances across requests
+    pipeline = build_pipeline(device=device, language=language)
+    if _loading_cancelled():
+        return
 
     print("Loading STT transcriber (faster-whisper)...")
-    stt_transcriber = FasterWhisperTranscriber(model_size="medium", device=device)
+    transcriber = FasterWhisperTranscriber(
+        model_size="medium",
+        device=device,
+        download_root=model_cache_dir
+    )
+    if _loading_cancelled():
+        return
+
+    # Warm both models up before reporting ready, so the first real
+    # requests don't absorb the cold-start latency
+    # Separately, so one failing doesn't leave the other cold
+    print("Warming up models...")
+    for name, warmup in (
+        ("Whisper IPA", pipeline.whisper_converter.warmup),
+        ("faster-whisper STT", transcriber.warmup),
+    ):
+        try:
+            warmup()
+        except Exception:
+            logger.warning("%s warmup failed (continuing)", name, exc_info=True)
+    if _loading_cancelled():
+        return
 
     # TTS disabled - using OpenAI TTS API instead (Chatterbox needs ~10GB RAM)
     # print("Loading TTS synthesizer (Chatterbox)...")
     # tts_synthesizer = ChatterboxSynthesizer(device=device)
 
+    gruut_converter = pipeline.gruut_converter
+    aligner = pipeline.aligner
+    stt_transcriber = transcriber
+
+    # Blocking model/CPU work runs here so it never stalls the event loop
+    cpu_executor = ThreadPoolExecutor(
+        max_workers=max(4, os.cpu_count() or 1),
+        thread_name_prefix="ml-cpu"
+    )
+    audio_fetcher = AudioFetcher(client=get_http_client(), executor=cpu_executor)
+    ipa_scheduler = BatchScheduler(pipeline.whisper_converter, executor=cpu_executor)
+
+    # Assigned last: get_models_loaded() keys off this
+    whisper_converter = pipeline.whisper_converter
+
     print("All models loaded successfully!")
 
 
+def _run_blocking(fn, *args, **kwargs) -> asyncio.Future:
+    """Run a blocking call on the shared executor, keeping it off the event loop."""
+    return asyncio.get_running_loop().run_in_executor(
+        cpu_executor, partial(fn, *args, **kwargs)
+    )
+
+
+async def _gather_or_cancel(*aws) -> list:
+    """
+    Await independent steps concurrently, cancelling the rest if one fails.
+
+    A bare asyncio.gather leaves the siblings of a failed awaitable running,
+    e.g. an audio download and its FFmpeg decode after the text conversion
+    has already raised.
+
+    Args:
+        *aws: Awaitables to run concurrently
+
+    Returns:
+        Their results, in order
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        # Let cancelled tasks finish their cleanup (e.g. killing FFmpeg)
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 @router.post("/analyze-pronunciation", response_model=PronunciationResponse)
 async def analyze_pronunciation(request: PronunciationRequest) -> PronunciationResponse:
     """
@@ -94,15 +216,21 @@ async def analyze_pronunciation(request: PronunciationRequest) -> PronunciationR
             )
         )
 
-    start_time = time.time()
+    # Monotonic clock: wall-clock time can step backwards under NTP
+    start_ns = time.perf_counter_ns()
 
     try:
-        # 1. Fetch and load audio
+        # 1. Fetch audio and convert expected text to IPA concurrently;
+        # the two are independent, so gruut runs while the download is in flight
         try:
-            audio_array, sample_rate, quality_report = await audio_fetcher.fetch_and_load(
-                request.audio_url,
-                apply_vad=True,
-                normalize=False
+            (audio_array, sample_rate, quality_report), expected_ipa = await _gather_or_cancel(
+                audio_fetcher.fetch_and_load(
+                    request.audio_url,
+                    apply_vad=True,
+                    normalize=False
+                ),
+                # Memoized per (text, language): practice prompts repeat a lot
+                _run_blocking(text_to_ipa_cached, request.expected_text, request.language)
             )
         except httpx.HTTPStatusError as e:
             return PronunciationResponse(
@@ -126,62 +254,60 @@ async def analyze_pronunciation(request: PronunciationRequest) -> PronunciationR
         # 2. Convert audio to IPA
         # Extract language code for Whisper (e.g., 'en' from 'en-us')
         whisper_lang = request.language.split("-")[0] if "-" in request.language else request.language
-        print(f"[DEBUG] Audio array shape: {audio_array.shape}, sample_rate: {sample_rate}")
-        print(f"[DEBUG] Audio duration: {len(audio_array) / sample_rate:.2f}s")
-        print(f"[DEBUG] Expected text: '{request.expected_text}'")
+        logger.debug("Audio array shape: %s, sample_rate: %d", audio_array.shape, sample_rate)
+        logger.debug("Audio duration: %.2fs", len(audio_array) / sample_rate)
+        logger.debug("Expected text: '%s'", request.expected_text)
 
-        audio_ipa = whisper_converter.audio_to_ipa(
+        # Batched with concurrent requests into one Whisper forward pass
+        audio_ipa = await ipa_scheduler.submit(
             audio_array,
             sample_rate,
             language=whisper_lang
         )
-        print(f"[DEBUG] Whisper audio_ipa: '{audio_ipa}'")
-
-        # 3. Convert expected text to IPA
-        # Create a new converter if language differs from default
-        if request.language != gruut_converter.language:
-            text_converter = GruutIPAConverter(language=request.language)
-        else:
-            text_converter = gruut_converter
-
-        expected_ipa = text_converter.text_to_ipa(request.expected_text)
-        print(f"[DEBUG] Gruut expected_ipa: '{expected_ipa}'")
-
-        # 4. Align phonemes (normalizer handles tie bars, prosodic markers, etc.)
-        # Debug: show extracted phonemes after normalization
-        audio_phonemes = aligner.extract_phonemes(audio_ipa)
-        expected_phonemes = aligner.extract_phonemes(expected_ipa)
-        print(f"[DEBUG] Audio phonemes ({len(audio_phonemes)}): {audio_phonemes}")
-        print(f"[DEBUG] Expected phonemes ({len(expected_phonemes)}): {expected_phonemes}")
-
-        alignment = aligner.align(audio_ipa, expected_ipa)
-
-        # Pretty print alignment
-        matches = sum(1 for _, _, t in alignment if t == "match")
-        print(f"[DEBUG] Alignment ({matches}/{len(alignment)} matches):")
-        for exp, act, typ in alignment:
-            symbol = "✓" if typ == "match" else "✗" if typ == "substitute" else "−" if typ == "delete" else "+"
-            print(f"  {symbol} expected='{exp}' actual='{act}' ({typ})")
-
-        # 5. Count statistics
-        match_count = sum(1 for _, _, t in alignment if t == "match")
-        substitution_count = sum(1 for _, _, t in alignment if t == "substitute")
-        deletion_count = sum(1 for _, _, t in alignment if t == "delete")
-        insertion_count = sum(1 for _, _, t in alignment if t == "insert")
-        phoneme_count = len(alignment)
-
-        # 6. Build phoneme details
+        logger.debug("Whisper audio_ipa: '%s'", audio_ipa)
+        logger.debug("Gruut expected_ipa: '%s'", expected_ipa)
+
+        # 3. Align phonemes (normalizer handles tie bars, prosodic markers, etc.)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            # Extra tokenization passes, only worth paying for when debugging
+            audio_phonemes = aligner.extract_phonemes(audio_ipa)
+            expected_phonemes = aligner.extract_phonemes(expected_ipa)
+            logger.debug("Audio phonemes (%d): %s", len(audio_phonemes), audio_phonemes)
+            logger.debug("Expected phonemes (%d): %s", len(expected_phonemes), expected_phonemes)
+
+        # Columnar result: (expected, actual, type_codes) instead of tuples
+        aligned_expected, aligned_actual, type_codes = await _run_blocking(
+            aligner.align_columns, audio_ipa, expected_ipa
+        )
+
+        if debug:
+            logger.debug(
+                "Alignment:\n%s",
+                _format_alignment(aligned_expected, aligned_actual, type_codes)
+            )
+
+        # 4. Count statistics (one C pass) and build phoneme details.
+        # The aligner's values are already well-typed, so model_construct
+        # skips per-phoneme validation
+        match_count, substitution_count, deletion_count, insertion_count = (
+            np.bincount(type_codes, minlength=len(MATCH_TYPES)).tolist()
+        )
+        phoneme_count = len(type_codes)
+
+        codes = type_codes.tolist()
         phoneme_details = [
-            PhonemeDetail(
-                expected=expected,
-                actual=actual,
-                type=match_type,
+            PhonemeDetail.model_construct(
+                expected=aligned_expected[i],
+                actual=aligned_actual[i],
+                type=MATCH_TYPES[codes[i]],
                 position=i
             )
-            for i, (expected, actual, match_type) in enumerate(alignment)
+            for i in range(phoneme_count)
         ]
 
-        # 7. Build audio quality report
+        # 5. Build audio quality report (validated: the loader's metrics may be
+        # numpy scalars, which pydantic coerces to plain floats)
         audio_quality = AudioQuality(
             quality_score=quality_report.get("quality_score", 100.0),
             snr_db=quality_report.get("snr_db", 0.0),
@@ -190,10 +316,10 @@ async def analyze_pronunciation(request: PronunciationRequest) -> PronunciationR
         )
 
         # Calculate processing time
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
-        # Build response
-        analysis = PronunciationAnalysis(
+        # Build response (fields are all built above, skip re-validation)
+        analysis = PronunciationAnalysis.model_construct(
             audio_ipa=audio_ipa,
             expected_ipa=expected_ipa,
             phoneme_count=phoneme_count,
@@ -231,6 +357,15 @@ async def analyze_pronunciation(request: PronunciationRequest) -> PronunciationR
         )
 
 
+def _format_alignment(expected, actual, type_codes) -> str:
+    """Render an alignment one phoneme pair per line for debug logs."""
+    symbols = ("✓", "✗", "−", "+")  # Indexed like MATCH_TYPES
+    return "\n".join(
+        f"  {symbols[code]} expected='{exp}' actual='{act}' ({MATCH_TYPES[code]})"
+        for exp, act, code in zip(expected, actual, type_codes.tolist())
+    )
+
+
 @router.post("/transcribe", response_model=TranscribeResponse)
 async def transcribe(request: TranscribeRequest) -> TranscribeResponse:
     """
@@ -278,8 +413,9 @@ async def transcribe(request: TranscribeRequest) -> TranscribeResponse:
                 )
             )
 
-        # 2. Transcribe audio
-        result = stt_transcriber.transcribe(
+        # 2. Transcribe audio (blocking model call - keep it off the event loop)
+        result = await _run_blocking(
+            stt_transcriber.transcribe,
             audio_array,
             sample_rate,
             language=request.language
@@ -323,20 +459,11 @@ async def synthesize(request: SynthesizeRequest) -> SynthesizeResponse:
         )
 
     try:
-        # Generate audio
-        if request.format == "mp3":
-            result = tts_synthesizer.synthesize_to_mp3(
-                request.text,
-                exaggeration=request.exaggeration
-            )
-        else:
-            result = tts_synthesizer.synthesize(
-                request.text,
-                exaggeration=request.exaggeration
-            )
+        result = await _run_synthesis(request)
 
-        # Encode audio as base64
-        audio_base64 = base64.b64encode(result.audio_bytes).decode("utf-8")
+        # Encode audio as base64 (a full pass over the payload - off the event loop)
+        encoded = await _run_blocking(base64.b64encode, result.audio_bytes)
+        audio_base64 = encoded.decode("ascii")
 
         return SynthesizeResponse(
             status="success",
@@ -354,3 +481,62 @@ async def synthesize(request: SynthesizeRequest) -> SynthesizeResponse:
                 retryable=True
             )
         )
+
+
+@router.post("/synthesize-stream")
+async def synthesize_stream(request: SynthesizeRequest) -> Response:
+    """
+    Synthesize speech from text and return the raw audio bytes.
+
+    Same as /synthesize but skips the base64/JSON wrapping (~33% smaller
+    payload, no decode on the client). The duration is returned in the
+    X-Duration header. Errors are returned as a SynthesizeResponse JSON body
+    with a non-2xx status code.
+    """
+    if tts_synthesizer is None:
+        return JSONResponse(
+            status_code=503,
+            content=SynthesizeResponse(
+                status="error",
+                error=PronunciationError(
+                    code="MODELS_NOT_LOADED",
+                    message="TTS model is not loaded. Server may still be starting.",
+                    retryable=True
+                )
+            ).model_dump()
+        )
+
+    try:
+        result = await _run_synthesis(request)
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content=SynthesizeResponse(
+                status="error",
+                error=PronunciationError(
+                    code="SYNTHESIS_ERROR",
+                    message=f"Failed to synthesize speech: {str(e)}",
+                    retryable=True
+                )
+            ).model_dump()
+        )
+
+    return Response(
+        content=result.audio_bytes,
+        media_type="audio/mpeg" if request.format == "mp3" else "audio/wav",
+        headers={"X-Duration": str(result.duration_seconds)}
+    )
+
+
+async def _run_synthesis(request: SynthesizeRequest) -> SynthesisResult:
+    """Generate audio in the requested format (blocking model call - off the event loop)."""
+    if request.format == "mp3":
+        synthesize_fn = tts_synthesizer.synthesize_to_mp3
+    else:
+        synthesize_fn = tts_synthesizer.synthesize
+
+    return await _run_blocking(
+        synthesize_fn,
+        request.text,
+        exaggeration=request.exaggeration
+    )
@@ -4,16 +4,20 @@ Audio loading and conversion utilities.
 Handles WebM files and converts them to format suitable for Whisper model.
 """
 
+import io
 import os
-import tempfile
+import subprocess
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from math import gcd
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 
 import librosa
 import numpy as np
 import soundfile as sf
-from pydub import AudioSegment
+from scipy.signal import resample_poly
 
 
 class AudioLoader:
@@ -21,16 +25,25 @@ class AudioLoader:
 
     WHISPER_SAMPLE_RATE = 16000  # Whisper requires 16kHz
 
-    def __init__(self, temp_dir: str = None):
-        """
-        Initialize AudioLoader.
+    # SIMD SoX resampler (python-soxr). Pinned rather than relying on
+    # librosa's default so a librosa upgrade can't silently swap it out
+    RESAMPLE_TYPE = 'soxr_hq'
+
+    # Decodes any FFmpeg-readable audio on stdin to 16kHz mono float32 PCM on stdout
+    FFMPEG_DECODE_COMMAND = (
+        'ffmpeg', '-loglevel', 'error',
+        '-i', 'pipe:0',
+        '-f', 'f32le', '-acodec', 'pcm_f32le',
+        '-ac', '1', '-ar', str(WHISPER_SAMPLE_RATE),
+        'pipe:1'
+    )
 
-        Args:
-            temp_dir: Directory for temporary file conversions.
-                     If None, uses system temp directory.
-        """
-        self.temp_dir = temp_dir or tempfile.gettempdir()
-        os.makedirs(self.temp_dir, exist_ok=True)
+    # Formats libsndfile can decode from memory; others go through FFmpeg
+    SOUNDFILE_EXTENSIONS = {'.wav', '.flac', '.ogg', '.mp3'}
+
+    # Clips at or below this length skip VAD trimming: there is little
+    # silence to remove and the framing pass dominates their preprocessing
+    VAD_MIN_DURATION = 1.5  # seconds
 
     def load_audio(
         self,
@@ -42,7 +55,7 @@ class AudioLoader:
         apply_preemphasis: bool = False
     ) -> Tuple[np.ndarray, int]:
         """
-        Load audio file, converting from WebM if needed.
+        Load audio file, decoding WebM and other compressed formats with FFmpeg.
 
         Args:
             file_path: Path to audio file (WebM, WAV, MP3, etc.)
@@ -67,28 +80,95 @@ class AudioLoader:
         file_path = Path(file_path)
         file_ext = file_path.suffix.lower()
 
-        # Convert WebM to WAV first (librosa doesn't natively support WebM)
-        if file_ext == '.webm':
-            wav_path = self._convert_webm_to_wav(str(file_path))
-            audio_array, sample_rate = self._load_wav(wav_path)
-            # Clean up temp file
-            try:
-                os.remove(wav_path)
-            except Exception:
-                pass  # Ignore cleanup errors
+        if file_ext in self.SOUNDFILE_EXTENSIONS:
+            audio_array, sample_rate = self._load_with_soundfile(str(file_path))
         else:
-            # Load directly with librosa
-            audio_array, sample_rate = librosa.load(
-                str(file_path),
-                sr=self.WHISPER_SAMPLE_RATE,
-                mono=True
-            )
+            # WebM/M4A/etc.: FFmpeg decodes straight to 16kHz PCM, no temp WAV
+            audio_array = self._decode_file_with_ffmpeg(str(file_path))
+            sample_rate = self.WHISPER_SAMPLE_RATE
+
+        return self.preprocess(
+            audio_array, sample_rate, apply_vad, normalize, vad_top_db,
+            reduce_noise, apply_preemphasis
+        )
+
+    def load_audio_from_bytes(
+        self,
+        data: bytes,
+        ext: str,
+        apply_vad: bool = True,
+        normalize: bool = False,
+        vad_top_db: int = 30,
+        reduce_noise: bool = False,
+        apply_preemphasis: bool = False
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Load audio from an in-memory buffer without touching disk.
+
+        Args:
+            data: Encoded audio file contents
+            ext: File extension describing the format (e.g. '.webm', '.wav')
+            apply_vad: If True, trim silence from beginning and end
+            normalize: If True, normalize audio volume
+            vad_top_db: Threshold for VAD in dB
+            reduce_noise: If True, apply noise reduction
+            apply_preemphasis: If True, apply pre-emphasis filter
+
+        Returns:
+            Tuple of (audio_array, sample_rate)
+
+        Raises:
+            RuntimeError: If the audio cannot be decoded
+        """
+        if ext.lower() in self.SOUNDFILE_EXTENSIONS:
+            audio_array, sample_rate = self._load_with_soundfile(io.BytesIO(data))
+        else:
+            # librosa can't read WebM/M4A; decode through an FFmpeg pipe
+            audio_array = self._decode_with_ffmpeg(data)
+            sample_rate = self.WHISPER_SAMPLE_RATE
+
+        return self.preprocess(
+            audio_array, sample_rate, apply_vad, normalize, vad_top_db,
+            reduce_noise, apply_preemphasis
+        )
+
+    def preprocess(
+        self,
+        audio_array: np.ndarray,
+        sample_rate: int,
+        apply_vad: bool = True,
+        normalize: bool = False,
+        vad_top_db: int = 30,
+        reduce_noise: bool = False,
+        apply_preemphasis: bool = False
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Apply the optional noise reduction, VAD, pre-emphasis and normalization steps.
+
+        Used on already-decoded audio (e.g. streamed through FFmpeg by the caller).
+
+        Args:
+            audio_array: Decoded mono audio samples
+            sample_rate: Sample rate of audio_array
+            apply_vad: If True, trim silence from beginning and end
+            normalize: If True, normalize audio volume
+            vad_top_db: Threshold for VAD in dB
+            reduce_noise: If True, apply noise reduction
+            apply_preemphasis: If True, apply pre-emphasis filter
+
+        Returns:
+            Tuple of (audio_array, sample_rate)
+        """
+        # Keep everything float32: float64 doubles the memory traffic of
+        # every pass below for no accuracy gain on 16-bit-class audio
+        caller_array = audio_array
+        audio_array = audio_array.astype(np.float32, copy=False)
 
         # Apply noise reduction (optional, requires noisereduce package)
         if reduce_noise:
             try:
                 import noisereduce as nr
-                audio_array = nr.reduce_noise(y=audio_array, sr=sample_rate)
+                audio_array = nr.reduce_noise(y=audio_array, sr=sample_rate).astype(np.float32, copy=False)
             except ImportError:
                 warnings.warn(
                     "noisereduce package not installed. "
@@ -96,26 +176,101 @@ class AudioLoader:
                 )
 
         # Apply VAD (Voice Activity Detection) - trim silence
-        if apply_vad:
-            audio_array, _ = librosa.effects.trim(
-                audio_array,
-                top_db=vad_top_db,
-                frame_length=2048,
-                hop_length=512
-            )
+        if apply_vad and len(audio_array) > self.VAD_MIN_DURATION * sample_rate:
+            audio_array = self._trim_silence(audio_array, top_db=vad_top_db)
 
         # Apply pre-emphasis filter (boost high frequencies)
         if apply_preemphasis:
-            audio_array = librosa.effects.preemphasis(audio_array, coef=0.97)
+            audio_array = self._preemphasis(audio_array, coef=0.97)
 
         # Normalize audio volume (peak normalization, not L2)
         if normalize:
-            max_val = np.max(np.abs(audio_array))
+            # Peak |x| from two reductions, without an np.abs temporary
+            max_val = max(audio_array.max(initial=0.0), -audio_array.min(initial=0.0))
             if max_val > 0:
-                audio_array = audio_array / max_val
+                scale = np.float32(1.0 / max_val)
+                # Scale in place only when an earlier step already gave us a
+                # private copy; never write into the caller's buffer
+                if audio_array.flags.writeable and not np.may_share_memory(audio_array, caller_array):
+                    np.multiply(audio_array, scale, out=audio_array)
+                else:
+                    audio_array = np.multiply(audio_array, scale)
 
         return audio_array, sample_rate
 
+    @staticmethod
+    def _trim_silence(
+        audio_array: np.ndarray,
+        top_db: float = 30,
+        frame_length: int = 2048,
+        hop_length: int = 512
+    ) -> np.ndarray:
+        """
+        Trim leading and trailing silence, like librosa.effects.trim.
+
+        Frames are centered and zero-padded as in librosa, and a frame is
+        silent when its mean power is more than top_db below the loudest
+        frame's. Frame powers come from differences of one cumulative sum
+        of squares instead of framing the signal, so the cost is a single
+        pass over the samples.
+
+        Args:
+            audio_array: Mono audio samples
+            top_db: Threshold below the peak frame power, in dB
+            frame_length: Samples per analysis frame
+            hop_length: Samples between frame starts
+
+        Returns:
+            View of audio_array with the silent ends removed
+        """
+        n = len(audio_array)
+        energy = np.empty(n + 1, dtype=np.float64)
+        energy[0] = 0.0
+        np.cumsum(np.square(audio_array, dtype=np.float64), out=energy[1:])
+
+        centers = np.arange(1 + n // hop_length) * hop_length
+        starts = np.clip(centers - frame_length // 2, 0, n)
+        ends = np.clip(centers + frame_length // 2, 0, n)
+        frame_powers = (energy[ends] - energy[starts]) / frame_length
+
+        # Same floor as librosa.power_to_db's amin
+        np.maximum(frame_powers, 1e-10, out=frame_powers)
+        threshold = frame_powers.max() * 10.0 ** (-top_db / 10.0)
+        non_silent = np.flatnonzero(frame_powers > threshold)
+
+        if len(non_silent) == 0:
+            return audio_array[:0]
+
+        start = non_silent[0] * hop_length
+        end = min(n, (non_silent[-1] + 1) * hop_length)
+        return audio_array[start:end]
+
+    @staticmethod
+    def _preemphasis(audio_array: np.ndarray, coef: float = 0.97) -> np.ndarray:
+        """
+        First-order pre-emphasis y[n] = x[n] - coef * x[n-1].
+
+        A direct two-term difference instead of librosa.effects.preemphasis's
+        general scipy.signal.lfilter call. The first sample reproduces
+        librosa's default initial state (2 * x[0] - x[1]), so the output
+        matches it exactly.
+
+        Args:
+            audio_array: Mono float32 audio samples
+            coef: Pre-emphasis coefficient
+
+        Returns:
+            New filtered array (the input is left untouched)
+        """
+        if len(audio_array) < 2:
+            return audio_array.copy()
+
+        out = np.empty_like(audio_array)
+        np.multiply(audio_array[:-1], audio_array.dtype.type(-coef), out=out[1:])
+        out[1:] += audio_array[1:]
+        out[0] = audio_array[0] + (2 * audio_array[0] - audio_array[1])
+        return out
+
     def assess_audio_quality(
         self,
         audio_array: np.ndarray,
@@ -138,13 +293,14 @@ class AudioLoader:
                 - 'quality_score': Overall quality score (0-100)
         """
         warnings_list = []
+        audio_array = audio_array.astype(np.float32, copy=False)
 
         # Calculate duration
         duration = len(audio_array) / sample_rate
 
         # Check for clipping (samples at or near ±1.0)
         clipping_threshold = 0.99
-        clipped_samples = np.sum(np.abs(audio_array) >= clipping_threshold)
+        clipped_samples = np.count_nonzero(np.abs(audio_array) >= clipping_threshold)
         clipping_ratio = clipped_samples / len(audio_array)
 
         if clipping_ratio > 0.01:  # More than 1% clipped
@@ -157,14 +313,20 @@ class AudioLoader:
         # Split into frames and find noise floor
         frame_length = 2048
         hop_length = 512
-        frames = librosa.util.frame(audio_array, frame_length=frame_length, hop_length=hop_length)
-        frame_powers = np.mean(frames ** 2, axis=0)
+        # Strided view (no copy) of shape (num_frames, frame_length); einsum
+        # sums the squares without materializing frames ** 2
+        if len(audio_array) >= frame_length:
+            frames = np.lib.stride_tricks.sliding_window_view(audio_array, frame_length)[::hop_length]
+            frame_powers = np.einsum('ij,ij->i', frames, frames) / frame_length
+        else:
+            # Shorter than one frame (the duration check below flags it)
+            frame_powers = np.empty(0, dtype=np.float32)
 
         # Assume bottom 10% of frames are noise
-        noise_floor = np.percentile(frame_powers, 10)
-        signal_power = np.mean(frame_powers)
+        noise_floor = self._percentile_10(frame_powers) if len(frame_powers) > 0 else 0.0
 
         if noise_floor > 0:
+            signal_power = frame_powers.mean(dtype=np.float32)
             snr_db = 10 * np.log10(signal_power / noise_floor)
         else:
             snr_db = float('inf')
@@ -177,7 +339,7 @@ class AudioLoader:
 
         # Calculate silence ratio
         silence_threshold = 0.01
-        silent_frames = np.sum(frame_powers < silence_threshold)
+        silent_frames = np.count_nonzero(frame_powers < silence_threshold)
         silence_ratio = silent_frames / len(frame_powers) if len(frame_powers) > 0 else 0
 
         if silence_ratio > 0.5:
@@ -219,6 +381,26 @@ class AudioLoader:
             'quality_score': quality_score
         }
 
+    @staticmethod
+    def _percentile_10(values: np.ndarray) -> float:
+        """
+        10th percentile via a partial sort.
+
+        Matches np.percentile's default linear interpolation but only
+        partitions (O(n) introselect) around the two neighbouring ranks.
+
+        Args:
+            values: 1-D array of values
+
+        Returns:
+            10th percentile of values
+        """
+        rank = 0.1 * (len(values) - 1)
+        lo = int(rank)
+        hi = min(lo + 1, len(values) - 1)
+        part = np.partition(values, (lo, hi))
+        return part[lo] + (part[hi] - part[lo]) * (rank - lo)
+
     def load_audio_with_quality_check(
         self,
         file_path: str,
@@ -257,64 +439,114 @@ class AudioLoader:
 
         return audio_array, sample_rate, quality_report
 
-    def _convert_webm_to_wav(self, webm_path: str) -> str:
+    def _decode_with_ffmpeg(self, data: bytes) -> np.ndarray:
         """
-        Convert WebM audio to WAV format using pydub + FFmpeg.
+        Decode encoded audio to 16kHz mono float32 by piping it through FFmpeg.
 
         Args:
-            webm_path: Path to WebM file
+            data: Encoded audio file contents
 
         Returns:
-            Path to converted WAV file
+            Audio samples as a float32 numpy array
 
         Raises:
-            RuntimeError: If conversion fails (FFmpeg not installed, etc.)
+            RuntimeError: If decoding fails (FFmpeg not installed, etc.)
         """
-        try:
-            # Load WebM with pydub (uses FFmpeg backend)
-            audio = AudioSegment.from_file(webm_path, format="webm")
+        return self._run_ffmpeg(self.FFMPEG_DECODE_COMMAND, data)
 
-            # Convert to mono and set sample rate
-            audio = audio.set_channels(1)  # Mono
-            audio = audio.set_frame_rate(self.WHISPER_SAMPLE_RATE)  # 16kHz
+    def _decode_file_with_ffmpeg(self, file_path: str) -> np.ndarray:
+        """
+        Decode an audio file to 16kHz mono float32 with a single FFmpeg call.
 
-            # Create temp WAV file
-            temp_wav = os.path.join(
-                self.temp_dir,
-                f"temp_{os.path.basename(webm_path)}.wav"
-            )
+        Args:
+            file_path: Path to audio file
 
-            # Export as WAV (16-bit PCM)
-            audio.export(
-                temp_wav,
-                format="wav",
-                parameters=["-acodec", "pcm_s16le"]
-            )
+        Returns:
+            Audio samples as a float32 numpy array
+
+        Raises:
+            RuntimeError: If decoding fails (FFmpeg not installed, etc.)
+        """
+        # 'file:' keeps FFmpeg from reading names like 'a:b.webm' as a protocol
+        command = tuple(
+            f'file:{file_path}' if arg == 'pipe:0' else arg
+            for arg in self.FFMPEG_DECODE_COMMAND
+        )
+        return self._run_ffmpeg(command, None)
 
-            return temp_wav
+    def _run_ffmpeg(self, command: Tuple[str, ...], data: Optional[bytes]) -> np.ndarray:
+        """
+        Run an FFmpeg decode command and read its float32 PCM output.
+
+        Args:
+            command: FFmpeg argv writing f32le samples to stdout
+            data: Bytes to feed on stdin, or None if the command reads a file
+
+        Returns:
+            Audio samples as a float32 numpy array
 
-        except Exception as e:
+        Raises:
+            RuntimeError: If FFmpeg is missing or exits with an error
+        """
+        try:
+            result = subprocess.run(
+                command,
+                input=data,
+                capture_output=True,
+                check=True
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            stderr = getattr(e, 'stderr', None)
+            detail = stderr.decode(errors='replace').strip() if stderr else str(e)
             raise RuntimeError(
-                f"Failed to convert WebM to WAV. "
-                f"Is FFmpeg installed? Error: {str(e)}"
+                f"Failed to decode audio with FFmpeg. "
+                f"Is FFmpeg installed? Error: {detail}"
             ) from e
 
-    def _load_wav(self, wav_path: str) -> Tuple[np.ndarray, int]:
+        return np.frombuffer(result.stdout, dtype=np.float32)
+
+    def _load_with_soundfile(self, source: Union[str, BinaryIO]) -> Tuple[np.ndarray, int]:
         """
-        Load WAV file with librosa.
+        Decode with libsndfile and resample to 16kHz mono float32.
+
+        Reading straight into float32 and resampling with a polyphase filter
+        skips librosa.load's audioread probing and intermediate copies.
+        Anything libsndfile can't open falls back to librosa for paths, and
+        to FFmpeg for file-like objects (librosa would only retry libsndfile
+        on those).
 
         Args:
-            wav_path: Path to WAV file
+            source: File path or file-like object
 
         Returns:
             Tuple of (audio_array, sample_rate)
+
+        Raises:
+            RuntimeError: If the FFmpeg fallback fails to decode the audio
         """
-        audio_array, sample_rate = librosa.load(
-            wav_path,
-            sr=self.WHISPER_SAMPLE_RATE,
-            mono=True
-        )
-        return audio_array, sample_rate
+        try:
+            audio_array, sample_rate = sf.read(source, dtype='float32', always_2d=False)
+        except sf.LibsndfileError:
+            if not isinstance(source, str):
+                source.seek(0)
+                return self._decode_with_ffmpeg(source.read()), self.WHISPER_SAMPLE_RATE
+            return librosa.load(
+                source,
+                sr=self.WHISPER_SAMPLE_RATE,
+                mono=True,
+                res_type=self.RESAMPLE_TYPE
+            )
+
+        if audio_array.ndim == 2:
+            audio_array = audio_array.mean(axis=1, dtype=np.float32)
+
+        if sample_rate != self.WHISPER_SAMPLE_RATE:
+            g = gcd(sample_rate, self.WHISPER_SAMPLE_RATE)
+            audio_array = resample_poly(
+                audio_array, self.WHISPER_SAMPLE_RATE // g, sample_rate // g
+            ).astype(np.float32, copy=False)
+
+        return audio_array, self.WHISPER_SAMPLE_RATE
 
 
 def load_audio_file(
@@ -344,3 +576,34 @@ def load_audio_file(
         file_path, apply_vad, normalize, vad_top_db,
         reduce_noise, apply_preemphasis
     )
+
+
+def load_audio_files(
+    file_paths: List[str],
+    workers: Optional[int] = None,
+    **kwargs
+) -> List[Tuple[np.ndarray, int]]:
+    """
+    Load many audio files in parallel across processes.
+
+    Each file is decoded and preprocessed independently, so the work spreads
+    across cores. Results come back in the same order as file_paths.
+
+    Args:
+        file_paths: Paths to audio files
+        workers: Number of worker processes (None = one per CPU core)
+        **kwargs: Preprocessing options passed to load_audio_file
+
+    Returns:
+        List of (audio_array, sample_rate) tuples, one per path
+
+    Raises:
+        FileNotFoundError: If any audio file doesn't exist
+        RuntimeError: If any audio file cannot be decoded
+    """
+    if len(file_paths) <= 1:
+        return [load_audio_file(path, **kwargs) for path in file_paths]
+
+    workers = min(workers or os.cpu_count() or 1, len(file_paths))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(partial(load_audio_file, **kwargs), file_paths))
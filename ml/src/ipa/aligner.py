@@ -4,10 +4,350 @@ Phoneme-level alignment between audio IPA and text IPA.
 Uses sequence alignment algorithms to match phonemes and identify substitutions.
 """
 
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
 
 from .normalizer import IPANormalizer
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# Scoring parameters
+MATCH_SCORE = 2
+SIMILAR_SCORE = 1
+MISMATCH_PENALTY = -1
+GAP_PENALTY = -2
+
+# Markers ignored when comparing phonemes for similarity
+_STRESS_MARKERS = 'ˈˌ'
+_LENGTH_MARKERS = ':ː'
+
+# Phonetically similar phoneme pairs, as unordered sets for O(1) lookup
+_SIMILAR_PAIRS = frozenset(frozenset(pair) for pair in (
+    # Voicing pairs (very common confusion)
+    ('p', 'b'), ('t', 'd'), ('k', 'g'),
+    ('f', 'v'), ('s', 'z'), ('θ', 'ð'), ('ʃ', 'ʒ'),
+    # Nasals
+    ('m', 'n'), ('n', 'ŋ'),
+    # Liquids
+    ('l', 'ɹ'), ('r', 'ɹ'), ('l', 'r'),
+    # Vowel pairs (common confusions)
+    ('i', 'ɪ'), ('u', 'ʊ'), ('e', 'ɛ'), ('o', 'ɔ'),
+    ('æ', 'ɛ'), ('ɑ', 'ɔ'), ('ʌ', 'ə'),
+    # Diphthong components
+    ('eɪ', 'e'), ('aɪ', 'a'), ('ɔɪ', 'ɔ'),
+    ('oʊ', 'o'), ('aʊ', 'a'),
+))
+
+# (expected, actual) -> substitution score, filled lazily by PhonemeAligner.
+# Bounded by the phoneme inventory squared, so it stays small and is never
+# evicted
+_PAIR_SCORES: Dict[Tuple[str, str], int] = {}
+
+# Alignment outcome codes, as returned by PhonemeAligner.align_columns
+MATCH_TYPES = ('match', 'substitute', 'delete', 'insert')
+MATCH, SUBSTITUTE, DELETE, INSERT = range(len(MATCH_TYPES))
+
+# Long alignments only fill a band of diagonals around the one joining the
+# table's corners: NW_BAND extra diagonals on each side, widened until the
+# band provably contains every optimal path
+NW_BAND = 32
+
+# Score for cells outside the band; far enough from int32 overflow that
+# adding penalties to it is safe
+_NEG_INF = -(1 << 28)
+
+
+@lru_cache(maxsize=4096)
+def _phoneme_forms(phoneme: str) -> Tuple[str, str]:
+    """
+    Strip a phoneme down to the forms phoneme_similarity compares.
+
+    Cached per phoneme (the inventory is small), so the string stripping
+    happens once per phoneme instead of once per compared pair.
+
+    Args:
+        phoneme: Phoneme string, possibly with stress/length markers
+
+    Returns:
+        Tuple of (base, core): without stress markers, and without stress
+        or length markers
+    """
+    base = phoneme.lstrip(_STRESS_MARKERS)
+    return base, base.rstrip(_LENGTH_MARKERS)
+
+
+def _nw_fill(sub: np.ndarray, gap: int) -> np.ndarray:
+    """
+    Fill the Needleman-Wunsch DP table cell by cell (numba-compiled).
+
+    Args:
+        sub: (m, n) int32 substitution score for each expected/actual pair
+        gap: Gap penalty
+
+    Returns:
+        (m + 1, n + 1) int32 table of best prefix alignment scores
+    """
+    m, n = sub.shape
+
+    dp = np.empty((m + 1, n + 1), dtype=np.int32)
+    for i in range(m + 1):
+        dp[i, 0] = i * gap
+    for j in range(n + 1):
+        dp[0, j] = j * gap
+
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            best = dp[i - 1, j - 1] + sub[i - 1, j - 1]
+            up = dp[i - 1, j] + gap
+            if up > best:
+                best = up
+            left = dp[i, j - 1] + gap
+            if left > best:
+                best = left
+            dp[i, j] = best
+
+    return dp
+
+
+def _nw_fill_numpy(sub: np.ndarray, gap: int) -> np.ndarray:
+    """
+    Fill the Needleman-Wunsch DP table one vectorized row at a time.
+
+    Used when numba isn't installed. Diagonal and up moves only depend on
+    the previous row; the left-move recurrence
+    dp[i, j] = max(cand[j], dp[i, j-1] + gap) unrolls to
+    dp[i, j] = j*gap + max_{k<=j}(cand[k] - k*gap), a running maximum.
+
+    Args:
+        sub: (m, n) int32 substitution score for each expected/actual pair
+        gap: Gap penalty
+
+    Returns:
+        (m + 1, n + 1) int32 table of best prefix alignment scores
+    """
+    m, n = sub.shape
+
+    dp = np.empty((m + 1, n + 1), dtype=np.int32)
+    dp[:, 0] = np.arange(m + 1, dtype=np.int32) * gap
+    dp[0, :] = np.arange(n + 1, dtype=np.int32) * gap
+
+    ramp = np.arange(n + 1, dtype=np.int32) * gap
+    cand = np.empty(n + 1, dtype=np.int32)
+
+    for i in range(1, m + 1):
+        prev = dp[i - 1]
+        cand[0] = i * gap
+        np.maximum(prev[:-1] + sub[i - 1], prev[1:] + gap, out=cand[1:])
+        cand -= ramp
+        np.maximum.accumulate(cand, out=cand)
+        np.add(cand, ramp, out=dp[i])
+
+    return dp
+
+
+def _nw_traceback(
+    dp: np.ndarray,
+    sub: np.ndarray,
+    gap: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Trace the optimal path back through a filled DP table.
+
+    Ties prefer the diagonal, then delete, then insert.
+
+    Args:
+        dp: (m + 1, n + 1) filled DP table
+        sub: (m, n) substitution scores used to fill it
+        gap: Gap penalty
+
+    Returns:
+        Tuple of (expected_idx, actual_idx, type_codes) arrays in alignment
+        order. Indices point into the expected/actual sequences, -1 for a
+        gap; type_codes index MATCH_TYPES.
+    """
+    m, n = sub.shape
+
+    # Filled from the back, since the traceback walks the path in reverse
+    expected_idx = np.empty(m + n, dtype=np.int32)
+    actual_idx = np.empty(m + n, dtype=np.int32)
+    type_codes = np.empty(m + n, dtype=np.int8)
+    k = m + n
+    i, j = m, n
+    while i > 0 or j > 0:
+        k -= 1
+        if i > 0 and j > 0 and dp[i, j] == dp[i - 1, j - 1] + sub[i - 1, j - 1]:
+            i -= 1
+            j -= 1
+            expected_idx[k] = i
+            actual_idx[k] = j
+            type_codes[k] = MATCH if sub[i, j] == MATCH_SCORE else SUBSTITUTE
+        elif i > 0 and (j == 0 or dp[i, j] == dp[i - 1, j] + gap):
+            i -= 1
+            expected_idx[k] = i
+            actual_idx[k] = -1
+            type_codes[k] = DELETE
+        else:
+            j -= 1
+            expected_idx[k] = -1
+            actual_idx[k] = j
+            type_codes[k] = INSERT
+
+    return expected_idx[k:], actual_idx[k:], type_codes[k:]
+
+
+def _nw_fill_banded(sub_band: np.ndarray, gap: int, lo: int, n: int) -> np.ndarray:
+    """
+    Fill only a diagonal band of the Needleman-Wunsch table (numba-compiled).
+
+    Row i of the band holds columns j = i + lo + c for c in [0, width);
+    cells with j outside [0, n] are set to _NEG_INF.
+
+    Args:
+        sub_band: (m, width) int32 substitution scores, sub_band[i - 1, c]
+            scoring the pair behind band cell (i, c)
+        gap: Gap penalty
+        lo: Lowest diagonal (j - i) inside the band
+        n: Length of the actual sequence
+
+    Returns:
+        (m + 1, width) int32 banded table of best prefix alignment scores
+    """
+    m, width = sub_band.shape
+
+    dp = np.empty((m + 1, width), dtype=np.int32)
+    for i in range(m + 1):
+        for c in range(width):
+            j = i + lo + c
+            if j < 0 or j > n:
+                dp[i, c] = _NEG_INF
+                continue
+            if i == 0:
+                dp[i, c] = j * gap
+                continue
+
+            # Out-of-band neighbours hold _NEG_INF, so they never win
+            best = dp[i - 1, c] + sub_band[i - 1, c]
+            if c + 1 < width:
+                up = dp[i - 1, c + 1] + gap
+                if up > best:
+                    best = up
+            if c > 0:
+                left = dp[i, c - 1] + gap
+                if left > best:
+                    best = left
+            dp[i, c] = best
+
+    return dp
+
+
+def _nw_fill_banded_numpy(sub_band: np.ndarray, gap: int, lo: int, n: int) -> np.ndarray:
+    """
+    Vectorized-row version of _nw_fill_banded, used when numba isn't installed.
+
+    Same running-maximum trick as _nw_fill_numpy, applied along the band.
+
+    Args:
+        sub_band: (m, width) int32 substitution scores for each band cell
+        gap: Gap penalty
+        lo: Lowest diagonal (j - i) inside the band
+        n: Length of the actual sequence
+
+    Returns:
+        (m + 1, width) int32 banded table of best prefix alignment scores
+    """
+    m, width = sub_band.shape
+
+    offsets = np.arange(width, dtype=np.int32)
+    ramp = offsets * gap
+    dp = np.empty((m + 1, width), dtype=np.int32)
+    cand = np.empty(width, dtype=np.int32)
+
+    j = lo + offsets
+    dp[0] = np.where((j >= 0) & (j <= n), j * gap, _NEG_INF)
+
+    for i in range(1, m + 1):
+        prev = dp[i - 1]
+        np.add(prev, sub_band[i - 1], out=cand)
+        np.maximum(cand[:-1], prev[1:] + gap, out=cand[:-1])
+        cand -= ramp
+        np.maximum.accumulate(cand, out=cand)
+        cand += ramp
+
+        j = i + lo + offsets
+        dp[i] = np.where((j >= 0) & (j <= n), cand, _NEG_INF)
+
+    return dp
+
+
+def _nw_traceback_banded(
+    dp: np.ndarray,
+    sub_band: np.ndarray,
+    gap: int,
+    lo: int,
+    n: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Trace the optimal path back through a banded DP table.
+
+    Mirrors _nw_traceback (same tie-breaking) in band coordinates.
+
+    Args:
+        dp: (m + 1, width) banded table from _nw_fill_banded
+        sub_band: (m, width) substitution scores used to fill it
+        gap: Gap penalty
+        lo: Lowest diagonal (j - i) inside the band
+        n: Length of the actual sequence
+
+    Returns:
+        Tuple of (expected_idx, actual_idx, type_codes) arrays, as for
+        _nw_traceback
+    """
+    m, width = sub_band.shape
+
+    expected_idx = np.empty(m + n, dtype=np.int32)
+    actual_idx = np.empty(m + n, dtype=np.int32)
+    type_codes = np.empty(m + n, dtype=np.int8)
+    k = m + n
+    i, j = m, n
+    while i > 0 or j > 0:
+        k -= 1
+        c = j - i - lo
+        if i > 0 and j > 0 and dp[i, c] == dp[i - 1, c] + sub_band[i - 1, c]:
+            expected_idx[k] = i - 1
+            actual_idx[k] = j - 1
+            type_codes[k] = MATCH if sub_band[i - 1, c] == MATCH_SCORE else SUBSTITUTE
+            i -= 1
+            j -= 1
+        elif i > 0 and (j == 0 or (c + 1 < width and dp[i, c] == dp[i - 1, c + 1] + gap)):
+            i -= 1
+            expected_idx[k] = i
+            actual_idx[k] = -1
+            type_codes[k] = DELETE
+        else:
+            j -= 1
+            expected_idx[k] = -1
+            actual_idx[k] = j
+            type_codes[k] = INSERT
+
+    return expected_idx[k:], actual_idx[k:], type_codes[k:]
+
+
+if njit is not None:
+    _nw_fill = njit(cache=True)(_nw_fill)
+    _nw_traceback = njit(cache=True)(_nw_traceback)
+    _nw_fill_banded = njit(cache=True)(_nw_fill_banded)
+    _nw_traceback_banded = njit(cache=True)(_nw_traceback_banded)
+else:
+    # Interpreted cell-by-cell loops are the slowest option; vectorize rows
+    _nw_fill = _nw_fill_numpy
+    _nw_fill_banded = _nw_fill_banded_numpy
+
 
 class PhonemeAligner:
     """
@@ -27,6 +367,14 @@ class PhonemeAligner:
         """
         self.normalizer = IPANormalizer(keep_stress=keep_stress, keep_length=True)
 
+        # Scores only depend on the phonemes, so aligners share one table
+        # (align_phonemes builds a fresh aligner per call). A subclass that
+        # redefines similarity gets its own
+        if type(self).phoneme_similarity is PhonemeAligner.phoneme_similarity:
+            self._pair_scores = _PAIR_SCORES
+        else:
+            self._pair_scores: Dict[Tuple[str, str], int] = {}
+
     def extract_phonemes(self, ipa_string: str) -> List[str]:
         """
         Extract individual phonemes from an IPA string.
@@ -57,42 +405,20 @@ class PhonemeAligner:
         if p1 == p2:
             return 1.0
 
-        # Strip stress markers for comparison
-        p1_base = p1.lstrip('ˈˌ')
-        p2_base = p2.lstrip('ˈˌ')
+        p1_base, p1_core = _phoneme_forms(p1)
+        p2_base, p2_core = _phoneme_forms(p2)
 
+        # Stress markers stripped
         if p1_base == p2_base:
             return 0.8  # Same phoneme, different stress
 
-        # Strip length markers too
-        p1_core = p1_base.rstrip(':ː')
-        p2_core = p2_base.rstrip(':ː')
-
+        # Length markers stripped too
         if p1_core == p2_core:
             return 0.8  # Same phoneme, different length
 
-        # Check for phonetically similar pairs
-        similar_pairs = [
-            # Voicing pairs (very common confusion)
-            ('p', 'b'), ('t', 'd'), ('k', 'g'),
-            ('f', 'v'), ('s', 'z'), ('θ', 'ð'), ('ʃ', 'ʒ'),
-            # Nasals
-            ('m', 'n'), ('n', 'ŋ'),
-            # Liquids
-            ('l', 'ɹ'), ('r', 'ɹ'), ('l', 'r'),
-            # Vowel pairs (common confusions)
-            ('i', 'ɪ'), ('u', 'ʊ'), ('e', 'ɛ'), ('o', 'ɔ'),
-            ('æ', 'ɛ'), ('ɑ', 'ɔ'), ('ʌ', 'ə'),
-            # Diphthong components
-            ('eɪ', 'e'), ('aɪ', 'a'), ('ɔɪ', 'ɔ'),
-            ('oʊ', 'o'), ('aʊ', 'a'),
-        ]
-
-        for pair in similar_pairs:
-            if (p1_core in pair and p2_core in pair) or \
-               (p1_core == pair[0] and p2_core == pair[1]) or \
-               (p1_core == pair[1] and p2_core == pair[0]):
-                return 0.5  # Phonetically similar
+        # Check for phonetically similar pairs (order-insensitive)
+        if frozenset((p1_core, p2_core)) in _SIMILAR_PAIRS:
+            return 0.5  # Phonetically similar
 
         return 0.0  # Completely different
 
@@ -118,6 +444,32 @@ class PhonemeAligner:
                 - 'delete': Expected phoneme missing (not said)
                 - 'insert': Extra phoneme said (not expected)
         """
+        expected, actual, type_codes = self.align_columns(audio_ipa, text_ipa)
+
+        return [
+            (e, a, MATCH_TYPES[code])
+            for e, a, code in zip(expected, actual, type_codes.tolist())
+        ]
+
+    def align_columns(
+        self,
+        audio_ipa: str,
+        text_ipa: str
+    ) -> Tuple[List[str], List[str], np.ndarray]:
+        """
+        Align like align(), but return parallel columns instead of tuples.
+
+        Cheaper for callers that aggregate over the alignment, e.g.
+        np.bincount(type_codes, minlength=len(MATCH_TYPES)) for the counts.
+
+        Args:
+            audio_ipa: IPA from audio (Whisper)
+            text_ipa: IPA from text (gruut)
+
+        Returns:
+            Tuple of (expected_phonemes, actual_phonemes, type_codes), where
+            type_codes is an int8 array indexing MATCH_TYPES
+        """
         audio_phonemes = self.extract_phonemes(audio_ipa)
         text_phonemes = self.extract_phonemes(text_ipa)
 
@@ -127,7 +479,7 @@ class PhonemeAligner:
         self,
         seq1: List[str],
         seq2: List[str]
-    ) -> List[Tuple[str, str, str]]:
+    ) -> Tuple[List[str], List[str], np.ndarray]:
         """
         Needleman-Wunsch global alignment algorithm.
 
@@ -136,95 +488,127 @@ class PhonemeAligner:
             seq2: Actual phoneme sequence (audio)
 
         Returns:
-            List of aligned (expected, actual, type) tuples
-        """
-        m, n = len(seq1), len(seq2)
-
-        # Scoring parameters
-        MATCH_SCORE = 2
-        SIMILAR_SCORE = 1
-        MISMATCH_PENALTY = -1
-        GAP_PENALTY = -2
-
-        # Initialize DP table
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-
-        # Initialize first row and column (gaps)
-        for i in range(m + 1):
-            dp[i][0] = i * GAP_PENALTY
-        for j in range(n + 1):
-            dp[0][j] = j * GAP_PENALTY
-
-        # Fill DP table
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                similarity = self.phoneme_similarity(seq1[i-1], seq2[j-1])
-
-                if similarity >= 0.8:
-                    score = MATCH_SCORE
-                elif similarity >= 0.5:
-                    score = SIMILAR_SCORE
-                else:
-                    score = MISMATCH_PENALTY
-
-                scores = [
-                    dp[i-1][j-1] + score,      # Match/mismatch
-                    dp[i-1][j] + GAP_PENALTY,  # Delete from seq1
-                    dp[i][j-1] + GAP_PENALTY   # Insert to seq1
-                ]
-                dp[i][j] = max(scores)
-
-        # Traceback to find alignment
-        alignment = []
-        i, j = m, n
-
-        while i > 0 or j > 0:
-            if i > 0 and j > 0:
-                similarity = self.phoneme_similarity(seq1[i-1], seq2[j-1])
-
-                if similarity >= 0.8:
-                    score = MATCH_SCORE
-                elif similarity >= 0.5:
-                    score = SIMILAR_SCORE
-                else:
-                    score = MISMATCH_PENALTY
-
-                if dp[i][j] == dp[i-1][j-1] + score:
-                    # Match or substitution
-                    expected = seq1[i-1]
-                    actual = seq2[j-1]
-
-                    if similarity >= 0.8:
-                        match_type = 'match'
-                    else:
-                        match_type = 'substitute'
-
-                    alignment.append((expected, actual, match_type))
-                    i -= 1
-                    j -= 1
-                    continue
-
-            if i > 0 and dp[i][j] == dp[i-1][j] + GAP_PENALTY:
-                # Delete from seq1 (expected phoneme not said)
-                alignment.append((seq1[i-1], '-', 'delete'))
-                i -= 1
-            elif j > 0 and dp[i][j] == dp[i][j-1] + GAP_PENALTY:
-                # Insert to seq1 (extra phoneme said)
-                alignment.append(('-', seq2[j-1], 'insert'))
-                j -= 1
-            else:
-                # Fallback
-                if i > 0:
-                    alignment.append((seq1[i-1], '-', 'delete'))
-                    i -= 1
-                if j > 0:
-                    alignment.append(('-', seq2[j-1], 'insert'))
-                    j -= 1
-
-        # Reverse to get correct order
-        alignment.reverse()
-
-        return alignment
+            Tuple of aligned (expected, actual, type_codes) columns
+        """
+        # Trivial cases the DP would only confirm: a perfect attempt aligns
+        # diagonally, and an empty side is all deletes or all inserts
+        if seq1 == seq2:
+            return list(seq1), list(seq2), np.full(len(seq1), MATCH, dtype=np.int8)
+        if not seq2:
+            return list(seq1), ['-'] * len(seq1), np.full(len(seq1), DELETE, dtype=np.int8)
+        if not seq1:
+            return ['-'] * len(seq2), list(seq2), np.full(len(seq2), INSERT, dtype=np.int8)
+
+        scores, ids1, ids2 = self._score_table(seq1, seq2)
+        expected_idx, actual_idx, type_codes = self._align_ids(scores, ids1, ids2)
+
+        # Map indices back to phonemes ('-' marks a gap)
+        expected = [seq1[k] if k >= 0 else '-' for k in expected_idx.tolist()]
+        actual = [seq2[k] if k >= 0 else '-' for k in actual_idx.tolist()]
+
+        return expected, actual, type_codes
+
+    @staticmethod
+    def _align_ids(
+        scores: np.ndarray,
+        ids1: np.ndarray,
+        ids2: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Run the DP over interned sequences, banded when that pays off.
+
+        A path that leaves the band needs at least |n - m| + 2 * (band + 1)
+        gaps, which caps its score. While the banded optimum beats that cap,
+        every optimal path lies inside the band and the result (including
+        tie-breaking) is identical to the full table's; otherwise the band
+        is doubled and the fill retried.
+
+        Args:
+            scores: (unique expected x unique actual) substitution scores
+            ids1: Expected sequence as indices into scores' rows
+            ids2: Actual sequence as indices into scores' columns
+
+        Returns:
+            Tuple of (expected_idx, actual_idx, type_codes), as for _nw_traceback
+        """
+        m, n = len(ids1), len(ids2)
+        diagonal = n - m
+
+        band = NW_BAND
+        while True:
+            lo = min(0, diagonal) - band
+            width = abs(diagonal) + 2 * band + 1
+            # Not worth it unless the band skips most of each row
+            if 2 * width > n + 1:
+                break
+
+            cols = np.arange(1, m + 1)[:, None] + lo + np.arange(width)
+            sub_band = scores[ids1[:, None], ids2[np.clip(cols - 1, 0, n - 1)]]
+            dp = _nw_fill_banded(sub_band, GAP_PENALTY, lo, n)
+
+            gaps = abs(diagonal) + 2 * (band + 1)
+            cap = gaps * GAP_PENALTY + (m + n - gaps) // 2 * MATCH_SCORE
+            if dp[m, n - m - lo] > cap:
+                return _nw_traceback_banded(dp, sub_band, GAP_PENALTY, lo, n)
+            band *= 2
+
+        sub = scores[np.ix_(ids1, ids2)]
+        dp = _nw_fill(sub, GAP_PENALTY)
+        return _nw_traceback(dp, sub, GAP_PENALTY)
+
+    def _score_table(
+        self,
+        seq1: List[str],
+        seq2: List[str]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Intern both sequences and score their unique phoneme pairs.
+
+        Each sequence's phonemes are interned to small integer ids and a
+        (unique expected x unique actual) score table is looked up from the
+        pair cache; phoneme_similarity only runs for pairs never seen
+        before. Indexing the table with the id arrays gives the full
+        substitution matrix (or any band of it).
+
+        Args:
+            seq1: Expected phoneme sequence (text)
+            seq2: Actual phoneme sequence (audio)
+
+        Returns:
+            Tuple of (scores, ids1, ids2): the int32 score table and each
+            sequence as intp indices into it
+        """
+        vocab1, vocab2 = {}, {}
+        ids1 = np.fromiter((vocab1.setdefault(p, len(vocab1)) for p in seq1), dtype=np.intp, count=len(seq1))
+        ids2 = np.fromiter((vocab2.setdefault(p, len(vocab2)) for p in seq2), dtype=np.intp, count=len(seq2))
+
+        cache = self._pair_scores
+        scores = np.array(
+            [
+                cache.get((p1, p2)) or self._pair_score(p1, p2)  # scores are never 0
+                for p1 in vocab1
+                for p2 in vocab2
+            ],
+            dtype=np.int32
+        ).reshape(len(vocab1), len(vocab2))
+
+        return scores, ids1, ids2
+
+    def _pair_score(self, p1: str, p2: str) -> int:
+        """Map phoneme similarity onto the DP's substitution score (cached)."""
+        score = self._score_similarity(self.phoneme_similarity(p1, p2))
+        self._pair_scores[(p1, p2)] = score
+        return score
+
+    @staticmethod
+    def _score_similarity(similarity: float) -> int:
+        """Map a similarity in [0, 1] onto the DP's substitution score."""
+
+        if similarity >= 0.8:
+            return MATCH_SCORE
+        elif similarity >= 0.5:
+            return SIMILAR_SCORE
+        return MISMATCH_PENALTY
 
 
 def align_phonemes(audio_ipa: str, text_ipa: str) -> List[Tuple[str, str, str]]:
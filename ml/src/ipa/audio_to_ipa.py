@@ -5,7 +5,8 @@ Uses neuralang/ipa-whisper-small model to transcribe audio directly to IPA.
 """
 
 import warnings
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
 
 import numpy as np
 import torch
@@ -14,6 +15,24 @@ from transformers import WhisperProcessor, WhisperForConditionalGeneration
 from .post_processor import IPAPostProcessor
 
 
+@lru_cache(maxsize=8)
+def get_whisper_processor(model_name: str) -> WhisperProcessor:
+    """
+    Get the processor for a model, loading it on first use.
+
+    Processors are read-only after loading (feature extractor settings and
+    tokenizer), so converters for the same model share one instead of each
+    re-reading the tokenizer files.
+
+    Args:
+        model_name: HuggingFace model name
+
+    Returns:
+        Cached WhisperProcessor for the model
+    """
+    return WhisperProcessor.from_pretrained(model_name)
+
+
 class WhisperIPAConverter:
     """
     Converts audio to IPA phonetic transcription using Whisper.
@@ -24,11 +43,18 @@ class WhisperIPAConverter:
 
     DEFAULT_MODEL = "neurlang/ipa-whisper-small"
 
+    # Long audio is cut at the quietest point in the last few seconds before
+    # each chunk limit, so chunk edges fall in pauses rather than mid-word
+    SPLIT_SEARCH_DURATION = 5.0  # seconds
+
     def __init__(
         self,
         model_name: str = DEFAULT_MODEL,
         device: Optional[str] = None,
-        post_process_language: str = 'en'
+        post_process_language: str = 'en',
+        torch_dtype: Optional[torch.dtype] = None,
+        load_in_8bit: bool = False,
+        compile_model: bool = False
     ):
         """
         Initialize Whisper IPA converter.
@@ -37,6 +63,13 @@ class WhisperIPAConverter:
             model_name: HuggingFace model name (default: neurlang/ipa-whisper-small)
             device: Device to run model on ('cuda', 'cpu', or None for auto-detect)
             post_process_language: Language for post-processing corrections (default: 'en')
+            torch_dtype: Weight/activation dtype (None = bfloat16 on GPUs that
+                support it, else float16 on CUDA and float32 on CPU)
+            load_in_8bit: If True, load int8 weights with bitsandbytes (CUDA only,
+                requires the bitsandbytes package)
+            compile_model: If True, decode with a static KV cache and a
+                torch.compile'd forward. Cuts per-token overhead, but the first
+                call for each new batch size pays a compile (run warmup())
         """
         self.model_name = model_name
         self.post_processor = IPAPostProcessor(language=post_process_language)
@@ -47,15 +80,37 @@ class WhisperIPAConverter:
         else:
             self.device = device
 
+        # Half precision runs the GEMMs on tensor cores and halves weight traffic
+        if torch_dtype is None:
+            if self.device.startswith("cuda"):
+                torch_dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+            else:
+                torch_dtype = torch.float32
+
         print(f"Loading Whisper IPA model: {model_name}")
-        print(f"Using device: {self.device}")
+        print(f"Using device: {self.device}, dtype: {torch_dtype}")
 
         # Load processor and model
-        self.processor = WhisperProcessor.from_pretrained(model_name)
-        self.model = WhisperForConditionalGeneration.from_pretrained(model_name)
+        self.processor = get_whisper_processor(model_name)
+
+        if load_in_8bit:
+            from transformers import BitsAndBytesConfig
+
+            # bitsandbytes places the quantized weights itself; they can't be moved
+            self.model = WhisperForConditionalGeneration.from_pretrained(
+                model_name,
+                quantization_config=BitsAndBytesConfig(load_in_8bit=True),
+                torch_dtype=torch_dtype,
+                device_map=self.device
+            )
+        else:
+            self.model = WhisperForConditionalGeneration.from_pretrained(
+                model_name,
+                torch_dtype=torch_dtype
+            )
 
-        # Move model to device
-        self.model.to(self.device)
+            # Move model to device
+            self.model.to(self.device)
 
         # CRITICAL: Configure model to avoid errors
         # These settings are required for the fine-tuned IPA model
@@ -66,6 +121,25 @@ class WhisperIPAConverter:
         if hasattr(self.model, 'generation_config'):
             self.model.generation_config.forced_decoder_ids = None
 
+        if compile_model:
+            # A preallocated cache keeps shapes fixed across decode steps, so
+            # CUDA graphs ("reduce-overhead") can replay them
+            self.model.generation_config.cache_implementation = "static"
+            self.model.forward = torch.compile(self.model.forward, mode="reduce-overhead")
+
+        # On CUDA, mel features are computed on the GPU (see _extract_features);
+        # the window and filterbank are uploaded once here
+        self._hann_window = None
+        self._mel_filters = None
+        if self.device.startswith("cuda"):
+            feature_extractor = self.processor.feature_extractor
+            self._hann_window = torch.hann_window(
+                feature_extractor.n_fft, device=self.device
+            )
+            self._mel_filters = torch.from_numpy(
+                feature_extractor.mel_filters
+            ).to(self.device, torch.float32).T
+
         print("Model loaded successfully!")
 
     def audio_to_ipa(
@@ -99,37 +173,11 @@ class WhisperIPAConverter:
                 f"Results may be degraded."
             )
 
-        # Process audio through WhisperProcessor
-        input_features = self.processor(
-            audio_array,
-            sampling_rate=sampling_rate,
-            return_tensors="pt"
-        ).input_features
-
-        # Move to same device as model
-        input_features = input_features.to(self.device)
+        # Log-mel features, already on the model's device
+        input_features = self._extract_features([audio_array], sampling_rate)
 
         # Prepare generation kwargs
-        generate_kwargs = {
-            "num_beams": num_beams,
-            "temperature": 0.0,  # Deterministic output
-            "do_sample": False,  # No sampling
-            "repetition_penalty": 1.2,  # Penalize repetition
-            "length_penalty": 1.0,  # Control length
-            "max_length": 448,  # Whisper max length
-        }
-
-        # Add language-specific hints if provided
-        if language:
-            try:
-                forced_decoder_ids = self.processor.get_decoder_prompt_ids(
-                    language=language,
-                    task="transcribe"
-                )
-                generate_kwargs["forced_decoder_ids"] = forced_decoder_ids
-            except Exception:
-                # Language not supported, continue without hints
-                pass
+        generate_kwargs = self._generate_kwargs(language, num_beams)
 
         # Add confidence tracking if requested
         if return_confidence:
@@ -137,7 +185,7 @@ class WhisperIPAConverter:
             generate_kwargs["output_scores"] = True
 
         # Generate IPA tokens
-        with torch.no_grad():
+        with torch.inference_mode():
             output = self.model.generate(input_features, **generate_kwargs)
 
         # Handle different output formats
@@ -166,6 +214,160 @@ class WhisperIPAConverter:
             return transcription, confidence
         return transcription
 
+    def warmup(self):
+        """
+        Run one throwaway inference so the first request doesn't pay for
+        CUDA context setup, kernel selection and allocator growth.
+        """
+        self.audio_to_ipa_batch([np.zeros(16000, dtype=np.float32)], language="en", num_beams=1)
+
+    def audio_to_ipa_batch(
+        self,
+        audio_arrays: List[np.ndarray],
+        sampling_rate: int = 16000,
+        language: Optional[str] = None,
+        num_beams: int = 5
+    ) -> List[str]:
+        """
+        Convert several audio clips to IPA in a single batched forward pass.
+
+        Every clip is padded to Whisper's 30s window by the processor, so a
+        batch costs about the same GPU time as a single clip.
+
+        Args:
+            audio_arrays: Audio clips as numpy arrays (each at most 30s)
+            sampling_rate: Sample rate of audio (should be 16000 for Whisper)
+            language: Language code for language-specific hints (shared by the batch)
+            num_beams: Number of beams for beam search
+
+        Returns:
+            IPA transcription strings, in the same order as audio_arrays
+        """
+        if not audio_arrays:
+            return []
+
+        if sampling_rate != 16000:
+            warnings.warn(
+                f"Whisper expects 16kHz audio, got {sampling_rate}Hz. "
+                f"Results may be degraded."
+            )
+
+        input_features = self._extract_features(audio_arrays, sampling_rate)
+
+        generate_kwargs = self._generate_kwargs(language, num_beams)
+
+        with torch.inference_mode():
+            predicted_ids = self.model.generate(input_features, **generate_kwargs)
+
+        transcriptions = self.processor.batch_decode(
+            predicted_ids,
+            skip_special_tokens=True
+        )
+
+        return [
+            self.post_processor.post_process(transcription.strip())
+            for transcription in transcriptions
+        ]
+
+    def _extract_features(
+        self,
+        audio_arrays: List[np.ndarray],
+        sampling_rate: int
+    ) -> torch.Tensor:
+        """
+        Compute Whisper log-mel input features on the model's device.
+
+        On CPU this defers to WhisperProcessor. On CUDA only the clips'
+        samples are copied over (in one transfer), padded to 30s on the
+        device and run through a single torch.stft, mirroring
+        WhisperFeatureExtractor's math.
+
+        Args:
+            audio_arrays: Audio clips as numpy arrays
+            sampling_rate: Sample rate of audio
+
+        Returns:
+            Tensor of shape (batch, n_mels, frames) on self.device, in the
+            model's dtype
+        """
+        if self._mel_filters is None:
+            return self.processor(
+                audio_arrays,
+                sampling_rate=sampling_rate,
+                return_tensors="pt"
+            ).input_features.to(self.device, self.model.dtype)
+
+        feature_extractor = self.processor.feature_extractor
+        n_samples = feature_extractor.n_samples
+
+        # Pack the clips (truncated to Whisper's 30s window) back to back, so
+        # the host-to-device copy carries real samples rather than padding
+        clips = [audio[:n_samples] for audio in audio_arrays]
+        packed = torch.empty(sum(len(clip) for clip in clips), dtype=torch.float32, pin_memory=True)
+        if clips:
+            np.concatenate(clips, out=packed.numpy())
+        packed = packed.to(self.device, non_blocking=True)
+
+        # Zero-pad each clip to the full window on the device
+        audio_gpu = torch.zeros((len(clips), n_samples), dtype=torch.float32, device=self.device)
+        offset = 0
+        for i, clip in enumerate(clips):
+            audio_gpu[i, :len(clip)] = packed[offset:offset + len(clip)]
+            offset += len(clip)
+
+        stft = torch.stft(
+            audio_gpu,
+            n_fft=feature_extractor.n_fft,
+            hop_length=feature_extractor.hop_length,
+            window=self._hann_window,
+            return_complex=True
+        )
+        magnitudes = stft[..., :-1].abs() ** 2
+
+        mel_spec = self._mel_filters @ magnitudes
+        log_spec = torch.clamp(mel_spec, min=1e-10).log10()
+
+        # Dynamic range compression, per clip
+        max_val = log_spec.amax(dim=(1, 2), keepdim=True)
+        log_spec = torch.maximum(log_spec, max_val - 8.0)
+
+        # Features are computed in float32, then cast to the model's dtype
+        return ((log_spec + 4.0) / 4.0).to(self.model.dtype)
+
+    def _generate_kwargs(self, language: Optional[str], num_beams: int) -> dict:
+        """
+        Build the generation kwargs shared by single and batched decoding.
+
+        Args:
+            language: Language code for language-specific hints, or None
+            num_beams: Number of beams for beam search
+
+        Returns:
+            Keyword arguments for model.generate
+        """
+        generate_kwargs = {
+            "num_beams": num_beams,
+            "temperature": 0.0,  # Deterministic output
+            "do_sample": False,  # No sampling
+            "repetition_penalty": 1.2,  # Penalize repetition
+            "length_penalty": 1.0,  # Control length
+            "max_length": 448,  # Whisper max length
+        }
+
+        # Add language-specific hints if provided
+        if language:
+            try:
+                forced_decoder_ids = self.processor.get_decoder_prompt_ids(
+                    language=language,
+                    task="transcribe"
+                )
+                generate_kwargs["forced_decoder_ids"] = forced_decoder_ids
+            except Exception:
+                # Language not supported, continue without hints
+                pass
+
+        return generate_kwargs
+
     def _calculate_confidence(self, scores) -> float:
         """
         Calculate average confidence score from generation scores.
@@ -179,14 +381,15 @@ class WhisperIPAConverter:
         if not scores:
             return 1.0
 
-        # Convert scores to probabilities and average
-        confidences = []
+        # Top softmax probability per step, as exp(max logit - logsumexp):
+        # no probability tensor is materialized, and the reductions stay on
+        # the device until the single .item() sync at the end
+        max_log_probs = []
         for score in scores:
-            probs = torch.softmax(score, dim=-1)
-            max_prob = torch.max(probs).item()
-            confidences.append(max_prob)
+            score = score.float()
+            max_log_probs.append((score.amax(dim=-1) - score.logsumexp(dim=-1)).max())
 
-        return sum(confidences) / len(confidences) if confidences else 1.0
+        return torch.stack(max_log_probs).exp().mean().item()
 
     def audio_to_ipa_chunked(
         self,
@@ -194,14 +397,15 @@ class WhisperIPAConverter:
         sampling_rate: int = 16000,
         chunk_duration: float = 30.0,
         language: Optional[str] = None,
-        num_beams: int = 5
+        num_beams: int = 5,
+        batch_size: int = 8
     ) -> str:
         """
         Convert long audio to IPA by processing in chunks.
 
         For audio longer than chunk_duration, this method splits
-        the audio into chunks and processes each separately, then
-        concatenates the results.
+        the audio into chunks at pauses, transcribes them in batched
+        forward passes, then concatenates the results.
 
         Args:
             audio_array: Audio samples as numpy array
@@ -209,6 +413,7 @@ class WhisperIPAConverter:
             chunk_duration: Duration of each chunk in seconds (default: 30)
             language: Language code for hints
             num_beams: Number of beams for beam search
+            batch_size: Maximum chunks per forward pass (bounds GPU memory)
 
         Returns:
             IPA transcription string
@@ -223,21 +428,23 @@ class WhisperIPAConverter:
 
         # Split into chunks
         chunk_samples = int(chunk_duration * sampling_rate)
+        search_samples = int(min(self.SPLIT_SEARCH_DURATION, chunk_duration / 2) * sampling_rate)
         chunks = []
 
-        for i in range(0, len(audio_array), chunk_samples):
-            chunk = audio_array[i:i + chunk_samples]
+        bounds = _chunk_boundaries(audio_array, chunk_samples, search_samples, sampling_rate)
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            chunk = audio_array[start:end]
             if len(chunk) > sampling_rate * 0.1:  # Skip chunks < 0.1s
                 chunks.append(chunk)
 
-        # Process each chunk
+        # Process chunks a batch at a time
         ipa_results = []
-        for i, chunk in enumerate(chunks):
-            print(f"Processing chunk {i+1}/{len(chunks)}...")
-            chunk_ipa = self.audio_to_ipa(
-                chunk, sampling_rate, language, num_beams
+        for start in range(0, len(chunks), batch_size):
+            batch = chunks[start:start + batch_size]
+            print(f"Processing chunks {start+1}-{start+len(batch)}/{len(chunks)}...")
+            ipa_results.extend(
+                self.audio_to_ipa_batch(batch, sampling_rate, language, num_beams)
             )
-            ipa_results.append(chunk_ipa)
 
         # Join with spaces
         return ' '.join(ipa_results)
@@ -258,6 +465,51 @@ class WhisperIPAConverter:
         return self.audio_to_ipa(audio_array, sample_rate)
 
 
+def _chunk_boundaries(
+    audio_array: np.ndarray,
+    chunk_samples: int,
+    search_samples: int,
+    sampling_rate: int
+) -> List[int]:
+    """
+    Choose chunk boundaries for long audio, cutting at the quietest moments.
+
+    Each chunk ends at the lowest-energy 25ms window (scanned every 10ms)
+    within search_samples before its chunk_samples limit; ties go to the
+    latest candidate. Window energies come from one cumulative sum of
+    squares, so the scan costs a single pass over the audio.
+
+    Args:
+        audio_array: Audio samples as numpy array
+        chunk_samples: Maximum samples per chunk
+        search_samples: How far before each limit to look for a pause
+        sampling_rate: Sample rate of audio
+
+    Returns:
+        Sample offsets [0, cut_1, ..., len(audio_array)]; chunk k spans
+        bounds[k]:bounds[k + 1]
+    """
+    n = len(audio_array)
+    energy = np.empty(n + 1, dtype=np.float64)
+    energy[0] = 0.0
+    np.cumsum(np.square(audio_array, dtype=np.float64), out=energy[1:])
+
+    half_window = int(0.0125 * sampling_rate)
+    hop = max(1, int(0.01 * sampling_rate))
+
+    bounds = [0]
+    while n - bounds[-1] > chunk_samples:
+        limit = bounds[-1] + chunk_samples
+        cuts = np.arange(limit, max(bounds[-1] + 1, limit - search_samples) - 1, -hop)
+        window_energy = (
+            energy[np.minimum(cuts + half_window, n)] - energy[np.maximum(cuts - half_window, 0)]
+        )
+        bounds.append(int(cuts[np.argmin(window_energy)]))
+    bounds.append(n)
+
+    return bounds
+
+
 def audio_to_ipa(
     audio_array: np.ndarray,
     sampling_rate: int = 16000,
@@ -5,8 +5,44 @@ Normalizes IPA strings to canonical form for consistent comparison
 between different sources (Whisper, gruut, etc.).
 """
 
+import re
+import sys
 import unicodedata
-from typing import List
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+# Characters with a nonzero Unicode combining class up to U+FFFF. The
+# astral planes are only scanned on first use (see _full_phoneme_pattern):
+# ~1M code points would add tens of milliseconds to every import
+_BMP_COMBINING = frozenset(chr(c) for c in range(0x10000) if unicodedata.combining(chr(c)))
+_ASTRAL_CHAR = re.compile('[\U00010000-\U0010ffff]')
+
+
+def _compile_phoneme_pattern(stress_markers: Set[str], marks: Set[str]) -> re.Pattern:
+    """
+    Compile the tokenizer behind IPANormalizer.extract_phonemes.
+
+    A token is a stress marker with an optional base character, or a base
+    character, either followed by any combining marks/modifiers; marks at
+    the start of a word form a token of their own.
+
+    Args:
+        stress_markers: Characters that start a new phoneme
+        marks: Characters that attach to the preceding phoneme
+
+    Returns:
+        Compiled pattern whose findall() yields the phonemes
+    """
+    stress = re.escape(''.join(sorted(stress_markers)))
+    marks = re.escape(''.join(sorted(marks)))
+    return re.compile(
+        f'[{stress}][^\\s{stress}{marks}]?[{marks}]*'
+        f'|[^\\s{stress}{marks}][{marks}]*'
+        f'|[{marks}]+'
+    )
 
 
 class IPANormalizer:
@@ -31,8 +67,8 @@ class IPANormalizer:
     CHAR_MAPPINGS = {
         'ɡ': 'g',      # U+0261 → U+0067 (IPA g → ASCII g)
         'ː': ':',      # U+02D0 → U+003A (IPA length → colon) - optional
-        ''': "'",      # Curly apostrophe → straight
-        ''': "'",
+        '’': "'",      # Curly apostrophe → straight
+        '‘': "'",
     }
 
     # R-colored vowel expansions (canonical form uses separate ɹ)
@@ -42,22 +78,10 @@ class IPANormalizer:
     }
 
     # Characters that are NOT phonemes (modifiers, diacritics, etc.)
-    # These should stay attached to the preceding phoneme
-    COMBINING_MARKS = set(
-        '\u0300\u0301\u0302\u0303\u0304\u0305\u0306\u0307'  # Combining accents
-        '\u0308\u0309\u030a\u030b\u030c\u030d\u030e\u030f'
-        '\u0310\u0311\u0312\u0313\u0314\u0315\u0316\u0317'
-        '\u0318\u0319\u031a\u031b\u031c\u031d\u031e\u031f'
-        '\u0320\u0321\u0322\u0323\u0324\u0325\u0326\u0327'
-        '\u0328\u0329\u032a\u032b\u032c\u032d\u032e\u032f'
-        '\u0330\u0331\u0332\u0333\u0334\u0335\u0336\u0337'
-        '\u0338\u0339\u033a\u033b\u033c\u033d\u033e\u033f'
-        '\u0340\u0341\u0342\u0343\u0344\u0345\u0346\u0347'
-        '\u0348\u0349\u034a\u034b\u034c\u034d\u034e\u034f'
-        '\u0350\u0351\u0352\u0353\u0354\u0355\u0356\u0357'
-        '\u0358\u0359\u035a\u035b\u035c\u035d\u035e\u035f'
-        '\u0360\u0361\u0362'  # Includes tie bar
-    )
+    # These should stay attached to the preceding phoneme: Combining
+    # Diacritical Marks U+0300-U+0362, including the tie bar. Kept explicit
+    # since U+034F has combining class 0 and unicodedata.combining misses it
+    COMBINING_MARKS = frozenset(map(chr, range(0x0300, 0x0363)))
 
     # IPA modifier letters that modify the preceding sound
     MODIFIER_LETTERS = {
@@ -77,6 +101,14 @@ class IPANormalizer:
     # for alignment purposes
     STRESS_MARKERS = {'ˈ', 'ˌ'}
 
+    # Phoneme tokenizer for extract_phonemes. re compiles a BMP-only class
+    # to a constant-time bitmap, but one reaching past U+FFFF to a slow list
+    # of ranges, so astral combining marks (never seen in practice) get
+    # their own pattern, built on demand by _full_phoneme_pattern
+    _PHONEME_PATTERN = _compile_phoneme_pattern(
+        STRESS_MARKERS, COMBINING_MARKS | MODIFIER_LETTERS | _BMP_COMBINING
+    )
+
     def __init__(self, keep_stress: bool = True, keep_length: bool = True):
         """
         Initialize IPA normalizer.
@@ -87,6 +119,28 @@ class IPANormalizer:
         """
         self.keep_stress = keep_stress
         self.keep_length = keep_length
+        self._translation = self._build_translation()
+
+    def _build_translation(self) -> dict:
+        """
+        Fold every single-character rewrite in normalize() into one str.translate table.
+
+        Returns:
+            Translation table for str.translate
+        """
+        table = {self.TIE_BAR: None}
+        table.update(dict.fromkeys(self.PROSODIC_MARKERS))
+        table.update(self.CHAR_MAPPINGS)
+        table.update(self.R_COLORED_VOWELS)
+
+        if not self.keep_stress:
+            table.update(dict.fromkeys(self.STRESS_MARKERS))
+
+        if not self.keep_length:
+            # Overrides the 'ː' → ':' mapping above
+            table.update(dict.fromkeys('ː:'))
+
+        return str.maketrans(table)
 
     def normalize(self, ipa_string: str) -> str:
         """
@@ -104,34 +158,135 @@ class IPANormalizer:
         # Step 1: Unicode NFC normalization
         result = unicodedata.normalize('NFC', ipa_string)
 
-        # Step 2: Remove tie bars (d͡ʒ → dʒ)
-        result = result.replace(self.TIE_BAR, '')
+        # Steps 2-7 in a single pass: remove tie bars (d͡ʒ → dʒ) and prosodic
+        # markers, apply character mappings, expand r-colored vowels, and
+        # optionally remove stress/length markers
+        result = result.translate(self._translation)
 
-        # Step 3: Remove prosodic markers
-        for marker in self.PROSODIC_MARKERS:
-            result = result.replace(marker, '')
+        # Step 8: Normalize whitespace
+        result = ' '.join(result.split())
 
-        # Step 4: Apply character mappings
-        for old, new in self.CHAR_MAPPINGS.items():
-            result = result.replace(old, new)
+        return result
 
-        # Step 5: Expand r-colored vowels
-        for old, new in self.R_COLORED_VOWELS.items():
-            result = result.replace(old, new)
+    # Below this length a plain loop beats NumPy's setup cost in compare()
+    _VECTORIZE_MIN_LENGTH = 32
 
-        # Step 6: Optionally remove stress markers
-        if not self.keep_stress:
-            for marker in self.STRESS_MARKERS:
-                result = result.replace(marker, '')
+    def compare(
+        self,
+        ipa1: str,
+        ipa2: str,
+        ignore_whitespace: bool = False
+    ) -> Dict[str, object]:
+        """
+        Compare two IPA strings character by character after normalization.
 
-        # Step 7: Optionally remove length markers
-        if not self.keep_length:
-            result = result.replace('ː', '').replace(':', '')
+        Args:
+            ipa1: First IPA string (e.g. from audio)
+            ipa2: Second IPA string (e.g. from text)
+            ignore_whitespace: If True, remove all spaces before comparing
 
-        # Step 8: Normalize whitespace
-        result = ' '.join(result.split())
+        Returns:
+            Dictionary containing:
+                - 'normalized_1', 'normalized_2': Normalized strings compared
+                - 'exact_match': True if they are identical
+                - 'length_1', 'length_2': Their lengths in characters
+                - 'differences': List of (position, char1, char2) tuples, with
+                  None for a position past the end of the shorter string
+        """
+        normalized_1 = self.normalize(ipa1)
+        normalized_2 = self.normalize(ipa2)
+
+        if ignore_whitespace:
+            normalized_1 = normalized_1.replace(' ', '')
+            normalized_2 = normalized_2.replace(' ', '')
+
+        return {
+            'normalized_1': normalized_1,
+            'normalized_2': normalized_2,
+            'exact_match': normalized_1 == normalized_2,
+            'length_1': len(normalized_1),
+            'length_2': len(normalized_2),
+            'differences': self._char_differences(normalized_1, normalized_2),
+        }
+
+    def _char_differences(
+        self,
+        s1: str,
+        s2: str
+    ) -> List[Tuple[int, Optional[str], Optional[str]]]:
+        """
+        List the positions where two strings differ.
 
-        return result
+        Long strings are compared as UTF-32 code point arrays, so the scan
+        runs in NumPy and only differing positions are visited in Python.
+
+        Args:
+            s1: First string
+            s2: Second string
+
+        Returns:
+            List of (position, char1, char2) tuples; None past a string's end
+        """
+        if s1 == s2:
+            return []
+
+        len1, len2 = len(s1), len(s2)
+        max_len = max(len1, len2)
+
+        if max_len < self._VECTORIZE_MIN_LENGTH:
+            positions = [
+                i for i in range(max_len)
+                if i >= len1 or i >= len2 or s1[i] != s2[i]
+            ]
+        else:
+            # 0xFFFFFFFF is not a valid code point, so padding never matches
+            codes1 = np.full(max_len, 0xFFFFFFFF, dtype=np.uint32)
+            codes2 = np.full(max_len, 0xFFFFFFFF, dtype=np.uint32)
+            codes1[:len1] = np.frombuffer(s1.encode('utf-32-le'), dtype=np.uint32)
+            codes2[:len2] = np.frombuffer(s2.encode('utf-32-le'), dtype=np.uint32)
+            positions = np.flatnonzero(codes1 != codes2).tolist()
+
+        return [
+            (i, s1[i] if i < len1 else None, s2[i] if i < len2 else None)
+            for i in positions
+        ]
+
+    # Below this length a generator join beats NumPy's setup cost in get_alignment()
+    _VECTORIZE_MIN_ALIGNMENT = 64
+
+    def get_alignment(self, ipa1: str, ipa2: str) -> Tuple[str, str, str]:
+        """
+        Line up two IPA strings character by character for display.
+
+        Both strings are normalized and the shorter one is padded with
+        spaces, so the three returned strings have the same length.
+
+        Args:
+            ipa1: First IPA string (e.g. from audio)
+            ipa2: Second IPA string (e.g. from text)
+
+        Returns:
+            Tuple of (aligned1, match_string, aligned2), where match_string
+            has '|' where the characters agree and ' ' where they differ
+        """
+        aligned1 = self.normalize(ipa1)
+        aligned2 = self.normalize(ipa2)
+
+        width = max(len(aligned1), len(aligned2))
+        aligned1 = aligned1.ljust(width)
+        aligned2 = aligned2.ljust(width)
+
+        if width < self._VECTORIZE_MIN_ALIGNMENT:
+            match_string = ''.join(
+                '|' if c1 == c2 else ' ' for c1, c2 in zip(aligned1, aligned2)
+            )
+        else:
+            codes1 = np.frombuffer(aligned1.encode('utf-32-le'), dtype=np.uint32)
+            codes2 = np.frombuffer(aligned2.encode('utf-32-le'), dtype=np.uint32)
+            match = np.where(codes1 == codes2, 0x7C, 0x20).astype('<u4')
+            match_string = match.tobytes().decode('utf-32-le')
+
+        return aligned1, match_string, aligned2
 
     def extract_phonemes(self, ipa_string: str) -> List[str]:
         """
@@ -147,52 +302,32 @@ class IPANormalizer:
             List of phoneme strings
         """
         normalized = self.normalize(ipa_string)
-        if not normalized:
-            return []
 
-        phonemes = []
-        current_phoneme = ""
-
-        for char in normalized:
-            # Skip whitespace
-            if char.isspace():
-                if current_phoneme:
-                    phonemes.append(current_phoneme)
-                    current_phoneme = ""
-                continue
-
-            # Check if this is a combining mark or modifier
-            is_combining = (
-                unicodedata.combining(char) != 0 or
-                char in self.COMBINING_MARKS or
-                char in self.MODIFIER_LETTERS
-            )
+        if _ASTRAL_CHAR.search(normalized):
+            return _full_phoneme_pattern().findall(normalized)
+        return self._PHONEME_PATTERN.findall(normalized)
+
+
+@lru_cache(maxsize=1)
+def _full_phoneme_pattern() -> re.Pattern:
+    """
+    Build the extract_phonemes tokenizer that also knows astral combining marks.
+
+    Returns:
+        Compiled pattern, built on first use and cached
+    """
+    astral_combining = frozenset(
+        chr(c) for c in range(0x10000, sys.maxunicode + 1) if unicodedata.combining(chr(c))
+    )
+    return _compile_phoneme_pattern(
+        IPANormalizer.STRESS_MARKERS,
+        IPANormalizer.COMBINING_MARKS | IPANormalizer.MODIFIER_LETTERS
+        | _BMP_COMBINING | astral_combining
+    )
 
-            if is_combining:
-                # Attach to current phoneme
-                current_phoneme += char
-            elif char in self.STRESS_MARKERS:
-                # Stress markers: save current phoneme, add stress as its own token
-                if current_phoneme:
-                    phonemes.append(current_phoneme)
-                    current_phoneme = ""
-                # Attach stress to the NEXT phoneme by starting a new one with it
-                current_phoneme = char
-            else:
-                # New base character
-                if current_phoneme and current_phoneme not in self.STRESS_MARKERS:
-                    # Save previous phoneme (unless it's just a stress marker waiting for its vowel)
-                    phonemes.append(current_phoneme)
-                    current_phoneme = char
-                else:
-                    # Either empty or stress marker - add this char to it
-                    current_phoneme += char
-
-        # Don't forget the last phoneme
-        if current_phoneme:
-            phonemes.append(current_phoneme)
-
-        return phonemes
+
+# Shared by the convenience functions below; normalizers hold no per-call state
+_DEFAULT_NORMALIZER = IPANormalizer()
 
 
 def normalize_ipa(ipa_string: str) -> str:
@@ -205,8 +340,22 @@ def normalize_ipa(ipa_string: str) -> str:
     Returns:
         Normalized IPA string
     """
-    normalizer = IPANormalizer()
-    return normalizer.normalize(ipa_string)
+    return _DEFAULT_NORMALIZER.normalize(ipa_string)
+
+
+def compare_ipa(ipa1: str, ipa2: str, ignore_whitespace: bool = False) -> Dict[str, object]:
+    """
+    Convenience function to compare two IPA strings.
+
+    Args:
+        ipa1: First IPA string
+        ipa2: Second IPA string
+        ignore_whitespace: If True, remove all spaces before comparing
+
+    Returns:
+        Comparison dictionary (see IPANormalizer.compare)
+    """
+    return _DEFAULT_NORMALIZER.compare(ipa1, ipa2, ignore_whitespace)
 
 
 def extract_phonemes(ipa_string: str) -> List[str]:
@@ -219,5 +368,4 @@ def extract_phonemes(ipa_string: str) -> List[str]:
     Returns:
         List of phoneme strings
     """
-    normalizer = IPANormalizer()
-    return normalizer.extract_phonemes(ipa_string)
+    return _DEFAULT_NORMALIZER.extract_phonemes(ipa_string)
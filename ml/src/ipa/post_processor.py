@@ -5,7 +5,52 @@ Fixes common mistakes made by Whisper IPA model and applies
 language-specific correction rules.
 """
 
-from typing import Dict, List, Optional
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
+
+# Runs of two or more spaces
+_MULTISPACE = re.compile(r' {2,}')
+
+
+def _compile_rules(rules: Dict[str, str]) -> List[Union[dict, Tuple[str, str]]]:
+    """
+    Compile ordered substitution rules into as few string passes as possible.
+
+    Consecutive single-character rules are merged into one str.translate
+    table, and multi-character rules stay (wrong, correct) pairs for
+    str.replace. A rule whose character appears in an earlier rule's output
+    starts a new table, so the result matches applying every rule
+    with str.replace in order.
+
+    Args:
+        rules: Ordered mapping of wrong -> correct substrings
+
+    Returns:
+        Steps to apply in order: translate tables and replace pairs
+    """
+    steps: List[Union[dict, Tuple[str, str]]] = []
+    table: Dict[str, str] = {}
+
+    for wrong, correct in rules.items():
+        if len(wrong) == 1 and not any(wrong in out for out in table.values()):
+            table[wrong] = correct
+            continue
+
+        if table:
+            steps.append(str.maketrans(table))
+            table = {}
+
+        if len(wrong) == 1:
+            table[wrong] = correct
+        else:
+            steps.append((wrong, correct))
+
+    if table:
+        steps.append(str.maketrans(table))
+
+    return steps
 
 
 class IPAPostProcessor:
@@ -52,6 +97,12 @@ class IPAPostProcessor:
         }
     }
 
+    # LANGUAGE_RULES compiled to translate/replace passes (see _compile_rules)
+    _RULE_STEPS = {
+        language: _compile_rules(rules)
+        for language, rules in LANGUAGE_RULES.items()
+    }
+
     def __init__(self, language: str = 'en'):
         """
         Initialize IPA post-processor.
@@ -96,22 +147,24 @@ class IPAPostProcessor:
 
     def _apply_language_rules(self, ipa_string: str) -> str:
         """Apply language-specific substitution rules."""
-        if self.language not in self.LANGUAGE_RULES:
+        steps = self._RULE_STEPS.get(self.language)
+        if steps is None:
             return ipa_string
 
-        rules = self.LANGUAGE_RULES[self.language]
         result = ipa_string
 
-        for wrong, correct in rules.items():
-            result = result.replace(wrong, correct)
+        for step in steps:
+            if isinstance(step, dict):
+                result = result.translate(step)
+            else:
+                result = result.replace(*step)
 
         return result
 
     def _normalize_spacing(self, ipa_string: str) -> str:
         """Normalize whitespace in IPA string."""
         # Remove multiple spaces
-        while '  ' in ipa_string:
-            ipa_string = ipa_string.replace('  ', ' ')
+        ipa_string = _MULTISPACE.sub(' ', ipa_string)
 
         # Remove spaces around certain characters
         # (stress marks shouldn't have spaces)
@@ -123,23 +176,26 @@ class IPAPostProcessor:
 
     def _fix_unicode_issues(self, ipa_string: str) -> str:
         """Fix common Unicode normalization issues."""
-        import unicodedata
+        # Normalize to NFC form (canonical composition). CPython's quick
+        # check returns already-NFC input (the usual case) without copying
+        #
+        # Character confusions (Latin g vs IPA ɡ, ':' vs 'ː') are left alone:
+        # replacing them outside IPA context could break valid characters
+        return unicodedata.normalize('NFC', ipa_string)
 
-        # Normalize to NFC form (canonical composition)
-        normalized = unicodedata.normalize('NFC', ipa_string)
 
-        # Fix common character confusions
-        replacements = {
-            'g': 'ɡ',  # Use IPA g (U+0261) not Latin g (U+0067)
-            ':': 'ː',  # Use IPA length marker (U+02D0) not colon
-        }
+@lru_cache(maxsize=8)
+def get_post_processor(language: str = 'en') -> IPAPostProcessor:
+    """
+    Get the shared post-processor for a language, creating it on first use.
 
-        for wrong, correct in replacements.items():
-            # Only replace in IPA context (not in all cases)
-            # This is a simplified version - more sophisticated logic could be added
-            pass  # Skip for now to avoid breaking valid characters
+    Args:
+        language: Language code (e.g., 'en', 'es', 'fr')
 
-        return normalized
+    Returns:
+        Cached IPAPostProcessor for the language
+    """
+    return IPAPostProcessor(language=language)
 
 
 def post_process_ipa(
@@ -158,5 +214,4 @@ def post_process_ipa(
     Returns:
         Post-processed IPA string
     """
-    processor = IPAPostProcessor(language=language)
-    return processor.post_process(ipa_string, expected_text)
+    return get_post_processor(language).post_process(ipa_string, expected_text)
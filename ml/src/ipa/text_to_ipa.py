@@ -5,6 +5,7 @@ Uses gruut to convert text to IPA, matching the format used to train
 the Whisper IPA model.
 """
 
+from functools import lru_cache
 from typing import List, Optional
 
 import gruut
@@ -46,25 +47,19 @@ class GruutIPAConverter:
             return ""
 
         try:
-            # Process text through gruut
-            phonemes = []
+            # Process text through gruut, one IPA string per word
+            words = []
 
             for sentence in gruut.sentences(text, lang=self.language):
                 for word in sentence:
                     # word.phonemes contains IPA phonemes for this word
                     if word.phonemes:
-                        phonemes.extend(word.phonemes)
-                        # Add space between words
-                        phonemes.append(" ")
+                        word_ipa = "".join(word.phonemes)
+                        if word_ipa:
+                            words.append(word_ipa)
 
-            # Join phonemes into string and clean up extra spaces
-            ipa_string = "".join(phonemes).strip()
-
-            # Clean up multiple spaces
-            while "  " in ipa_string:
-                ipa_string = ipa_string.replace("  ", " ")
-
-            return ipa_string
+            # Space-separated words; no stray spaces to clean up afterwards
+            return " ".join(words)
 
         except Exception as e:
             raise ValueError(
@@ -83,14 +78,30 @@ class GruutIPAConverter:
         Returns:
             List of IPA phonemes
         """
-        phonemes = []
+        return [
+            phoneme
+            for sentence in gruut.sentences(text, lang=self.language)
+            for word in sentence
+            if word.phonemes
+            for phoneme in word.phonemes
+        ]
+
+
+@lru_cache(maxsize=8)
+def get_gruut_converter(language: str = "en-us") -> GruutIPAConverter:
+    """
+    Get the shared converter for a language, creating it on first use.
+
+    Converters hold no per-call state, so one instance per language is
+    reused across requests instead of being rebuilt each time.
 
-        for sentence in gruut.sentences(text, lang=self.language):
-            for word in sentence:
-                if word.phonemes:
-                    phonemes.extend(word.phonemes)
+    Args:
+        language: Language code (e.g., 'en-us', 'de')
 
-        return phonemes
+    Returns:
+        Cached GruutIPAConverter for the language
+    """
+    return GruutIPAConverter(language=language)
 
 
 def text_to_ipa(text: str, language: str = "en-us") -> str:
@@ -104,5 +115,29 @@ def text_to_ipa(text: str, language: str = "en-us") -> str:
     Returns:
         IPA transcription string
     """
-    converter = GruutIPAConverter(language=language)
-    return converter.text_to_ipa(text)
+    return get_gruut_converter(language).text_to_ipa(text)
+
+
+def text_to_ipa_cached(text: str, language: str = "en-us") -> str:
+    """
+    Convert text to IPA, memoizing results for repeated prompts.
+
+    Practice prompts repeat across users and attempts, and gruut is
+    deterministic, so repeat conversions become a dict lookup. Only
+    surrounding whitespace is normalized; case is preserved because
+    gruut can pronounce it differently (e.g. "US" vs "us").
+
+    Args:
+        text: Input text
+        language: Language code (default: en-us)
+
+    Returns:
+        IPA transcription string
+    """
+    return _text_to_ipa_cached(text.strip(), language)
+
+
+@lru_cache(maxsize=4096)
+def _text_to_ipa_cached(text: str, language: str) -> str:
+    """Cached conversion keyed on the already-stripped text."""
+    return get_gruut_converter(language).text_to_ipa(text)
@@ -0,0 +1,42 @@
+"""
+Construction of the pronunciation analysis pipeline.
+
+Shared by the API (built once per process at startup) and the CLI
+(built once per invocation) so both load models the same way.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from src.ipa.aligner import PhonemeAligner
+from src.ipa.audio_to_ipa import WhisperIPAConverter
+from src.ipa.text_to_ipa import GruutIPAConverter, get_gruut_converter
+
+
+@dataclass
+class PronunciationPipeline:
+    """The models and helpers needed to analyze a pronunciation attempt."""
+    whisper_converter: WhisperIPAConverter
+    gruut_converter: GruutIPAConverter
+    aligner: PhonemeAligner
+
+
+def build_pipeline(
+    device: Optional[str] = None,
+    language: str = "en-us"
+) -> PronunciationPipeline:
+    """
+    Load the Whisper IPA model and build the text-to-IPA and alignment helpers.
+
+    Args:
+        device: Device for Whisper model ('cuda', 'cpu', or None for auto)
+        language: Default language for text-to-IPA
+
+    Returns:
+        PronunciationPipeline with all components loaded
+    """
+    return PronunciationPipeline(
+        whisper_converter=WhisperIPAConverter(device=device),
+        gruut_converter=get_gruut_converter(language),
+        aligner=PhonemeAligner(),
+    )
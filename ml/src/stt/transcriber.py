@@ -4,11 +4,11 @@ Speech-to-text transcription using faster-whisper.
 Uses CTranslate2-based Whisper implementation for efficient inference.
 """
 
+import os
 from dataclasses import dataclass
 from typing import Optional
 
 import numpy as np
-from faster_whisper import WhisperModel
 
 
 @dataclass
@@ -31,7 +31,10 @@ class FasterWhisperTranscriber:
         self,
         model_size: str = "medium",
         device: Optional[str] = None,
-        compute_type: str = "auto"
+        compute_type: str = "auto",
+        cpu_threads: Optional[int] = None,
+        num_workers: int = 2,
+        download_root: Optional[str] = None
     ):
         """
         Initialize the transcriber.
@@ -39,7 +42,12 @@ class FasterWhisperTranscriber:
         Args:
             model_size: Whisper model size ('tiny', 'base', 'small', 'medium', 'large-v3')
             device: Device to run on ('cuda', 'cpu', or None for auto-detect)
-            compute_type: Compute type ('auto', 'float16', 'int8', etc.)
+            compute_type: Compute type ('auto', 'int8_float16', 'int8', etc.)
+            cpu_threads: CPU threads for CTranslate2 (None = half the cores)
+            num_workers: Concurrent transcriptions the model can run in parallel
+            download_root: Directory to download/cache the converted model in
+                (None = Hugging Face cache); point at a persistent volume so
+                restarts skip the download
         """
         self.model_size = model_size
 
@@ -50,9 +58,16 @@ class FasterWhisperTranscriber:
 
         self.device = device
 
-        # Adjust compute type based on device
+        # Adjust compute type based on device: int8 weights halve memory
+        # traffic on both, with float16 activations on GPU
         if compute_type == "auto":
-            compute_type = "float16" if device == "cuda" else "int8"
+            compute_type = "int8_float16" if device == "cuda" else "int8"
+
+        if cpu_threads is None:
+            cpu_threads = max(1, (os.cpu_count() or 2) // 2)
+
+        # Imported here so the API and CLI don't pay the CTranslate2 import cost up front
+        from faster_whisper import WhisperModel
 
         print(f"Loading faster-whisper model: {model_size}")
         print(f"Device: {device}, Compute type: {compute_type}")
@@ -60,11 +75,26 @@ class FasterWhisperTranscriber:
         self.model = WhisperModel(
             model_size,
             device=device,
-            compute_type=compute_type
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=num_workers,
+            download_root=download_root
         )
 
         print("Faster-whisper model loaded successfully!")
 
+    def warmup(self):
+        """
+        Run one throwaway transcription so the first request doesn't pay for
+        CTranslate2's lazy allocation and kernel selection.
+        """
+        silence = np.zeros(16000, dtype=np.float32)
+
+        # VAD off: on silence it would drop everything and skip the model
+        segments, _ = self.model.transcribe(silence, language="en", beam_size=1, vad_filter=False)
+        for _ in segments:  # segments are generated lazily
+            pass
+
     def transcribe(
         self,
         audio_array: np.ndarray,
@@ -8,9 +8,6 @@ import io
 from dataclasses import dataclass
 from typing import Optional
 
-import torch
-import torchaudio
-
 
 @dataclass
 class SynthesisResult:
@@ -40,6 +37,8 @@ class ChatterboxSynthesizer:
             device: Device to run on ('cuda', 'cpu', or None for auto-detect)
             use_turbo: Use Chatterbox-Turbo model (faster, slightly lower quality)
         """
+        import torch
+
         # Auto-detect device
         if device is None:
             device = "cuda" if torch.cuda.is_available() else "cpu"
@@ -79,6 +78,8 @@ class ChatterboxSynthesizer:
         Returns:
             SynthesisResult with audio bytes, sample rate, and duration
         """
+        import torchaudio
+
         # Generate audio
         if self.use_turbo:
             # Turbo model has different API
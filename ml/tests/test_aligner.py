@@ -1,7 +1,52 @@
 """Tests for phoneme alignment."""
 
+import random
+
+import numpy as np
 import pytest
-from src.ipa.aligner import PhonemeAligner, align_phonemes
+from src.ipa.aligner import (
+    GAP_PENALTY,
+    MATCH,
+    MATCH_SCORE,
+    NW_BAND,
+    PhonemeAligner,
+    _nw_fill,
+    _nw_fill_banded,
+    _nw_fill_banded_numpy,
+    _nw_fill_numpy,
+    _nw_traceback,
+    _nw_traceback_banded,
+    align_phonemes,
+)
+
+PHONEMES = ["p", "b", "t", "d", "k", "g", "s", "z", "m", "n", "i", "ɪ", "e", "ɛ", "ə", "ˈa", "aɪ", "uː"]
+
+
+def _mutate(rng, seq, rate):
+    """Copy seq with random substitutions, deletions and insertions."""
+    out = []
+    for p in seq:
+        roll = rng.random()
+        if roll < rate / 3:
+            out.append(rng.choice(PHONEMES))
+        elif roll < 2 * rate / 3:
+            continue
+        elif roll < rate:
+            out.extend([p, rng.choice(PHONEMES)])
+        else:
+            out.append(p)
+    return out
+
+
+def _full_alignment(scores, ids1, ids2):
+    """Reference result: the unbanded DP over the whole table."""
+    sub = scores[np.ix_(ids1, ids2)]
+    return _nw_traceback(_nw_fill(sub, GAP_PENALTY), sub, GAP_PENALTY)
+
+
+def _assert_same_alignment(result, reference):
+    for got, want in zip(result, reference):
+        np.testing.assert_array_equal(got, want)
 
 
 class TestPhonemeSimilarity:
@@ -185,3 +230,122 @@ class TestRealWorldExamples:
         # "bird" /bɝd/
         result = self.aligner.align("bɝd", "bɝd")
         assert all(t == "match" for e, a, t in result)
+
+
+class TestBandedAlignment:
+    """The banded DP must reproduce the full DP exactly, ties included."""
+
+    def setup_method(self):
+        self.aligner = PhonemeAligner()
+
+    def _case(self, rng, m, n, rate):
+        expected = [rng.choice(PHONEMES) for _ in range(m)]
+        actual = _mutate(rng, expected, rate)
+        # Pad or trim the actual side to skew the lengths as requested
+        actual = (actual + [rng.choice(PHONEMES) for _ in range(n)])[:n]
+        return self.aligner._score_table(expected, actual)
+
+    @pytest.mark.parametrize("m,n", [
+        (NW_BAND, NW_BAND),
+        (NW_BAND + 1, 2 * NW_BAND),
+        (200, 200),
+        (300, 340),
+        (500, 420),
+        (150, 400),
+    ])
+    @pytest.mark.parametrize("rate", [0.05, 0.3, 1.0])
+    def test_matches_full_dp(self, m, n, rate):
+        rng = random.Random(m * 1000 + n + int(rate * 100))
+        for _ in range(5):
+            scores, ids1, ids2 = self._case(rng, m, n, rate)
+            _assert_same_alignment(
+                PhonemeAligner._align_ids(scores, ids1, ids2),
+                _full_alignment(scores, ids1, ids2)
+            )
+
+    @pytest.mark.parametrize("m,n", [(200, 200), (400, 430), (430, 400)])
+    def test_band_kernels_match_full_dp(self, m, n):
+        """Near-identical long inputs take the banded path; check it directly."""
+        rng = random.Random(m + n)
+        scores, ids1, ids2 = self._case(rng, m, n, 0.05)
+        m, n = len(ids1), len(ids2)
+
+        diagonal = n - m
+        lo = min(0, diagonal) - NW_BAND
+        width = abs(diagonal) + 2 * NW_BAND + 1
+        cols = np.arange(1, m + 1)[:, None] + lo + np.arange(width)
+        sub_band = scores[ids1[:, None], ids2[np.clip(cols - 1, 0, n - 1)]]
+
+        dp = _nw_fill_banded(sub_band, GAP_PENALTY, lo, n)
+        np.testing.assert_array_equal(dp, _nw_fill_banded_numpy(sub_band, GAP_PENALTY, lo, n))
+
+        # The score cap from _align_ids holds, so the band is exact
+        gaps = abs(diagonal) + 2 * (NW_BAND + 1)
+        assert dp[m, n - m - lo] > gaps * GAP_PENALTY + (m + n - gaps) // 2 * MATCH_SCORE
+
+        sub = scores[np.ix_(ids1, ids2)]
+        assert dp[m, n - m - lo] == _nw_fill(sub, GAP_PENALTY)[m, n]
+        _assert_same_alignment(
+            _nw_traceback_banded(dp, sub_band, GAP_PENALTY, lo, n),
+            _full_alignment(scores, ids1, ids2)
+        )
+
+
+class TestNumpyFill:
+    """The NumPy fallback must fill the same table as the compiled kernel."""
+
+    @pytest.mark.parametrize("m,n", [(1, 1), (1, 7), (7, 1), (12, 12), (40, 25), (25, 90)])
+    def test_matches_cell_by_cell_fill(self, m, n):
+        rng = np.random.default_rng(m * 100 + n)
+        # Every score the aligner can produce, so ties between moves are common
+        sub = rng.choice(
+            np.array([MATCH_SCORE, 1, -1], dtype=np.int32), size=(m, n)
+        ).astype(np.int32)
+
+        dp = _nw_fill(sub, GAP_PENALTY)
+        dp_numpy = _nw_fill_numpy(sub, GAP_PENALTY)
+
+        np.testing.assert_array_equal(dp, dp_numpy)
+        _assert_same_alignment(
+            _nw_traceback(dp_numpy, sub, GAP_PENALTY),
+            _nw_traceback(dp, sub, GAP_PENALTY)
+        )
+
+
+class TestShortcuts:
+    """Identical and empty inputs skip the DP but must agree with it."""
+
+    def setup_method(self):
+        self.aligner = PhonemeAligner()
+
+    def _general_path(self, seq1, seq2):
+        scores, ids1, ids2 = self.aligner._score_table(seq1, seq2)
+        expected_idx, actual_idx, type_codes = PhonemeAligner._align_ids(scores, ids1, ids2)
+        expected = [seq1[k] if k >= 0 else '-' for k in expected_idx.tolist()]
+        actual = [seq2[k] if k >= 0 else '-' for k in actual_idx.tolist()]
+        return expected, actual, type_codes
+
+    @pytest.mark.parametrize("seq1,seq2", [
+        (["k", "æ", "t"], ["k", "æ", "t"]),
+        (["ˈa", "b"] * 100, ["ˈa", "b"] * 100),
+        (["k", "æ", "t"], []),
+        ([], ["k", "æ", "t"]),
+        ([], []),
+    ])
+    def test_same_as_general_path(self, seq1, seq2):
+        expected, actual, type_codes = self.aligner._needleman_wunsch(seq1, seq2)
+        ref_expected, ref_actual, ref_codes = self._general_path(seq1, seq2)
+
+        assert expected == ref_expected
+        assert actual == ref_actual
+        assert type_codes.dtype == ref_codes.dtype
+        np.testing.assert_array_equal(type_codes, ref_codes)
+
+    def test_align_columns_shortcuts(self):
+        expected, actual, type_codes = self.aligner.align_columns("kæt", "kæt")
+        assert expected == actual == ["k", "æ", "t"]
+        assert type_codes.tolist() == [MATCH] * 3
+
+        assert self.aligner.align("kæt", "") == [("-", "k", "insert"), ("-", "æ", "insert"), ("-", "t", "insert")]
+        assert self.aligner.align("", "kæt") == [("k", "-", "delete"), ("æ", "-", "delete"), ("t", "-", "delete")]
+        assert self.aligner.align_columns("", "")[2].size == 0
@@ -0,0 +1,49 @@
+"""Tests for audio fetching helpers."""
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("librosa")
+
+from src.api.audio_fetcher import _pick_extension  # noqa: E402
+
+
+class TestPickExtension:
+    """Test choosing the decode extension from Content-Type and URL."""
+
+    @pytest.mark.parametrize("content_type,expected", [
+        ("audio/webm", ".webm"),
+        ("video/webm", ".webm"),
+        ("audio/wav", ".wav"),
+        ("audio/x-wav", ".wav"),
+        ("audio/mpeg", ".mp3"),
+        ("audio/flac", ".flac"),
+        ("audio/ogg", ".ogg"),
+        ("audio/mp4", ".m4a"),
+        ("audio/webm;codecs=opus", ".webm"),
+        ("Audio/MPEG; charset=binary", ".mp3"),
+    ])
+    def test_content_type(self, content_type, expected):
+        """A known Content-Type wins, ignoring parameters and case."""
+        assert _pick_extension(content_type, "https://bucket.example.com/clip.wav") == expected
+
+    @pytest.mark.parametrize("url,expected", [
+        ("https://bucket.example.com/rec/clip.mp3", ".mp3"),
+        ("https://bucket.example.com/rec/clip.WAV", ".wav"),
+        ("https://bucket.example.com/rec/clip.flac?X-Amz-Signature=abc.webm", ".flac"),
+        ("https://bucket.example.com/rec/clip.m4a?sig=1#part.ogg", ".m4a"),
+        ("https://bucket.example.com/rec/clip.ogg#t=1.5", ".ogg"),
+    ])
+    def test_url_path(self, url, expected):
+        """Without a usable Content-Type, the URL path (not query/fragment) decides."""
+        assert _pick_extension("application/octet-stream", url) == expected
+
+    @pytest.mark.parametrize("content_type,url", [
+        ("application/octet-stream", "https://bucket.example.com/rec/clip"),
+        ("", "https://bucket.example.com/rec/clip?format=.mp3"),
+        ("text/plain", "https://bucket.example.com/rec/clip.txt"),
+        ("audio/aac", "https://bucket.example.com/rec/"),
+    ])
+    def test_default_fallback(self, content_type, url):
+        """Unknown types with no recognised path extension default to webm."""
+        assert _pick_extension(content_type, url) == ".webm"
@@ -0,0 +1,138 @@
+"""Tests for the Whisper IPA micro-batch scheduler."""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+from src.api.batching import BatchScheduler
+
+
+class FakeConverter:
+    """Stands in for WhisperIPAConverter; each clip's IPA is its first sample."""
+
+    def __init__(self, fail_language=None, gate=None):
+        self.calls = []
+        self.fail_language = fail_language
+        self.gate = gate
+        self.started = threading.Event()
+
+    def audio_to_ipa_batch(self, audio_arrays, sampling_rate=16000, language=None):
+        self.calls.append((len(audio_arrays), sampling_rate, language))
+        self.started.set()
+        if self.gate is not None:
+            self.gate.wait()
+        if self.fail_language is not None and language == self.fail_language:
+            raise ValueError(f"bad batch for {language}")
+        return [f"ipa{int(audio[0])}" for audio in audio_arrays]
+
+
+def _clip(value):
+    return np.full(160, value, dtype=np.float32)
+
+
+class TestBatchScheduler:
+    """Test batching, error propagation and shutdown."""
+
+    def test_concurrent_submits_share_a_batch(self):
+        """Concurrent requests run as one forward pass, each getting its own result."""
+        converter = FakeConverter()
+
+        async def scenario():
+            scheduler = BatchScheduler(converter, max_batch_size=8, max_wait_ms=50)
+            results = await asyncio.gather(*(scheduler.submit(_clip(i)) for i in range(5)))
+            await scheduler.close()
+            return results
+
+        assert asyncio.run(scenario()) == [f"ipa{i}" for i in range(5)]
+        assert converter.calls == [(5, 16000, None)]
+
+    def test_max_batch_size(self):
+        """A burst larger than max_batch_size is split across passes."""
+        converter = FakeConverter()
+
+        async def scenario():
+            scheduler = BatchScheduler(converter, max_batch_size=3, max_wait_ms=50)
+            results = await asyncio.gather(*(scheduler.submit(_clip(i)) for i in range(7)))
+            await scheduler.close()
+            return results
+
+        assert asyncio.run(scenario()) == [f"ipa{i}" for i in range(7)]
+        assert [size for size, _, _ in converter.calls] == [3, 3, 1]
+
+    def test_groups_by_rate_and_language(self):
+        """Only clips with the same sample rate and language share a pass."""
+        converter = FakeConverter()
+
+        async def scenario():
+            scheduler = BatchScheduler(converter, max_batch_size=8, max_wait_ms=50)
+            results = await asyncio.gather(
+                scheduler.submit(_clip(0), 16000, "en"),
+                scheduler.submit(_clip(1), 16000, "es"),
+                scheduler.submit(_clip(2), 16000, "en"),
+                scheduler.submit(_clip(3), 8000, "en"),
+            )
+            await scheduler.close()
+            return results
+
+        assert asyncio.run(scenario()) == ["ipa0", "ipa1", "ipa2", "ipa3"]
+        assert sorted(converter.calls) == [(1, 8000, "en"), (1, 16000, "es"), (2, 16000, "en")]
+
+    def test_error_reaches_only_its_group(self):
+        """A failed pass fails its own waiters; other groups still succeed."""
+        converter = FakeConverter(fail_language="es")
+
+        async def scenario():
+            scheduler = BatchScheduler(converter, max_batch_size=8, max_wait_ms=50)
+            results = await asyncio.gather(
+                scheduler.submit(_clip(0), language="en"),
+                scheduler.submit(_clip(1), language="es"),
+                scheduler.submit(_clip(2), language="es"),
+                return_exceptions=True
+            )
+            # The worker survives a failed batch
+            results.append(await scheduler.submit(_clip(3), language="en"))
+            await scheduler.close()
+            return results
+
+        ok, err1, err2, later = asyncio.run(scenario())
+        assert ok == "ipa0"
+        assert isinstance(err1, ValueError) and isinstance(err2, ValueError)
+        assert later == "ipa3"
+
+    def test_close_fails_in_flight_and_queued(self):
+        """close() fails both the running batch's waiters and queued ones."""
+        gate = threading.Event()
+        converter = FakeConverter(gate=gate)
+
+        async def scenario():
+            scheduler = BatchScheduler(converter, max_batch_size=1, max_wait_ms=0)
+            in_flight = asyncio.create_task(scheduler.submit(_clip(0)))
+            while not converter.started.is_set():
+                await asyncio.sleep(0.001)
+            queued = asyncio.create_task(scheduler.submit(_clip(1)))
+            await asyncio.sleep(0.01)
+
+            try:
+                await scheduler.close()
+            finally:
+                gate.set()
+            return await asyncio.gather(in_flight, queued, return_exceptions=True)
+
+        for result in asyncio.run(scenario()):
+            assert isinstance(result, RuntimeError)
+
+    def test_submit_after_close(self):
+        """A closed scheduler rejects new work instead of restarting."""
+        converter = FakeConverter()
+
+        async def scenario():
+            scheduler = BatchScheduler(converter)
+            assert await scheduler.submit(_clip(0)) == "ipa0"
+            await scheduler.close()
+            with pytest.raises(RuntimeError):
+                await scheduler.submit(_clip(1))
+            assert scheduler._worker is None
+
+        asyncio.run(scenario())
+        assert len(converter.calls) == 1
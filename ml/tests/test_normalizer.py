@@ -0,0 +1,124 @@
+"""Tests for IPA normalization and comparison."""
+
+import pytest
+from src.ipa.normalizer import IPANormalizer, compare_ipa
+
+
+class TestCompare:
+    """Test character-level comparison of normalized IPA."""
+
+    def setup_method(self):
+        self.normalizer = IPANormalizer()
+
+    def test_equal_strings(self):
+        """Identical strings match with no differences."""
+        result = self.normalizer.compare("kæt", "kæt")
+
+        assert result['exact_match'] is True
+        assert result['differences'] == []
+        assert result['length_1'] == result['length_2'] == 3
+
+    @pytest.mark.parametrize("ipa1,ipa2", [
+        ("ɡoʊ", "goʊ"),            # IPA g vs ASCII g
+        ("d͡ʒʌmp", "dʒʌmp"),       # Tie bar
+        ("bɚd", "bəɹd"),           # R-colored vowel
+        ("hɛ.loʊ", "hɛloʊ"),       # Syllable boundary
+        ("kæt  dɔɡ", "kæt dɔg"),   # Whitespace and mapping together
+    ])
+    def test_equal_after_normalization(self, ipa1, ipa2):
+        """Variant spellings of the same IPA compare equal."""
+        result = self.normalizer.compare(ipa1, ipa2)
+
+        assert result['exact_match'] is True
+        assert result['normalized_1'] == result['normalized_2']
+        assert result['differences'] == []
+
+    def test_substitution(self):
+        """A differing character is reported with its position."""
+        result = self.normalizer.compare("θɪŋk", "sɪŋk")
+
+        assert result['exact_match'] is False
+        assert result['differences'] == [(0, 'θ', 's')]
+
+    def test_length_mismatch(self):
+        """Positions past the shorter string report None."""
+        result = self.normalizer.compare("kæts", "kæt")
+
+        assert result['length_1'] == 4
+        assert result['length_2'] == 3
+        assert result['differences'] == [(3, 's', None)]
+
+    def test_ignore_whitespace(self):
+        """Spaces can be dropped before comparing."""
+        assert not self.normalizer.compare("ðə kæt", "ðəkæt")['exact_match']
+        assert self.normalizer.compare("ðə kæt", "ðəkæt", ignore_whitespace=True)['exact_match']
+
+    @pytest.mark.parametrize("length", [5, IPANormalizer._VECTORIZE_MIN_LENGTH, 100])
+    def test_loop_and_vectorized_paths_agree(self, length):
+        """Short (loop) and long (NumPy) strings give the same differences."""
+        s1 = ("ʃɪp" * length)[:length]
+        s2 = s1[:length // 2] + "θ" + s1[length // 2 + 1:] + "ɛx"
+
+        expected = [
+            (i, s1[i] if i < len(s1) else None, s2[i] if i < len(s2) else None)
+            for i in range(max(len(s1), len(s2)))
+            if i >= len(s1) or i >= len(s2) or s1[i] != s2[i]
+        ]
+        assert self.normalizer.compare(s1, s2)['differences'] == expected
+
+    def test_convenience_function(self):
+        """compare_ipa matches the method."""
+        assert compare_ipa("ɡoʊ", "goʊ") == self.normalizer.compare("ɡoʊ", "goʊ")
+
+
+class TestGetAlignment:
+    """Test the character alignment used for display."""
+
+    def setup_method(self):
+        self.normalizer = IPANormalizer()
+
+    def test_pads_shorter_string(self):
+        """Both strings come back normalized and equally long."""
+        aligned1, match_str, aligned2 = self.normalizer.get_alignment("hɛloʊ", "hɛl")
+
+        assert aligned1 == "hɛloʊ"
+        assert aligned2 == "hɛl  "
+        assert match_str == "|||  "
+
+    def test_normalizes_first(self):
+        """Variant spellings line up as matches."""
+        _, match_str, _ = self.normalizer.get_alignment("d͡ʒɚ", "dʒəɹ")
+        assert match_str == "||||"
+
+    def test_empty(self):
+        assert self.normalizer.get_alignment("", "") == ("", "", "")
+
+    @pytest.mark.parametrize("length", [
+        1,
+        IPANormalizer._VECTORIZE_MIN_ALIGNMENT - 1,
+        IPANormalizer._VECTORIZE_MIN_ALIGNMENT,
+        IPANormalizer._VECTORIZE_MIN_ALIGNMENT + 1,
+        300,
+    ])
+    def test_join_and_vectorized_paths_agree(self, length):
+        """Strings on either side of the threshold get the same match line."""
+        s1 = ("ðəkæt" * length)[:length]
+        s2 = "".join("θ" if i % 7 == 3 else c for i, c in enumerate(s1))[:max(1, length - 2)]
+
+        aligned1, match_str, aligned2 = self.normalizer.get_alignment(s1, s2)
+
+        assert len(aligned1) == len(match_str) == len(aligned2) == length
+        assert match_str == "".join("|" if c1 == c2 else " " for c1, c2 in zip(aligned1, aligned2))
+
+    @pytest.mark.parametrize("ipa1,ipa2", [
+        ("kæt", "kɛt"),
+        ("ðə kwɪk bɹaʊn fɑks" * 5, "ðə kwɪk bɹaʊn fɔks" * 4),
+    ])
+    def test_forced_paths_identical(self, ipa1, ipa2):
+        """Forcing each implementation on the same input gives the same result."""
+        joined = IPANormalizer()
+        joined._VECTORIZE_MIN_ALIGNMENT = float("inf")
+        vectorized = IPANormalizer()
+        vectorized._VECTORIZE_MIN_ALIGNMENT = 0
+
+        assert joined.get_alignment(ipa1, ipa2) == vectorized.get_alignment(ipa1, ipa2)
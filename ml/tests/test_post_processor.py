@@ -0,0 +1,59 @@
+"""Tests for IPA post-processing rules."""
+
+import random
+
+import pytest
+from src.ipa.post_processor import IPAPostProcessor, _compile_rules
+
+
+def _apply_in_order(rules, text):
+    """Reference: one str.replace pass per rule, in dict order."""
+    for wrong, correct in rules.items():
+        text = text.replace(wrong, correct)
+    return text
+
+
+def _apply_steps(steps, text):
+    for step in steps:
+        text = text.translate(step) if isinstance(step, dict) else text.replace(*step)
+    return text
+
+
+class TestLanguageRules:
+    """Compiled rule steps must match applying each rule in order."""
+
+    @pytest.mark.parametrize("language", sorted(IPAPostProcessor.LANGUAGE_RULES))
+    def test_matches_sequential_replace(self, language):
+        rules = IPAPostProcessor.LANGUAGE_RULES[language]
+        processor = IPAPostProcessor(language)
+        alphabet = "rɹəɜʁɚɝaːˈ "
+        rng = random.Random(language)
+
+        for _ in range(2000):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+            assert processor._apply_language_rules(text) == _apply_in_order(rules, text)
+
+    def test_english_examples(self):
+        processor = IPAPostProcessor('en')
+        assert processor._apply_language_rules("rɛd") == "ɹɛd"
+        assert processor._apply_language_rules("bəɹd") == "bɚd"
+        # 'r' is rewritten first, so the 'ɜr' rule never fires
+        assert processor._apply_language_rules("bɜrd") == "bɜɹd"
+
+    def test_unknown_language_unchanged(self):
+        assert IPAPostProcessor('de')._apply_language_rules("rɹ") == "rɹ"
+
+    @pytest.mark.parametrize("rules", [
+        {'a': 'b', 'b': 'c'},           # Chained single-character rules
+        {'b': 'c', 'a': 'b'},
+        {'a': 'bc', 'c': 'a'},          # Later rule rewrites an earlier output
+        {'a': '', 'ab': 'x', 'b': 'a'},
+        {'ab': 'c', 'c': 'ab', 'a': 'c'},
+    ])
+    def test_compiled_steps_preserve_order(self, rules):
+        rng = random.Random(str(rules))
+        steps = _compile_rules(rules)
+
+        for _ in range(500):
+            text = "".join(rng.choice("abc") for _ in range(rng.randint(0, 12)))
+            assert _apply_steps(steps, text) == _apply_in_order(rules, text)